@@ -41,137 +41,652 @@ you will see more meeting types appear in your CSV along with a new
 """
 
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.dammit import EncodingDetector
+from lxml import etree, html as lxml_html
+import csv
+import html
 import re
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlparse, urlsplit
 import time
 import logging
-from datetime import datetime
+import math
+from datetime import datetime, timedelta
 import os
-import json
-from typing import Union, Dict, Optional, List
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
+from itertools import islice
+from typing import Union, Dict, Optional, List, Tuple
+
+try:
+    import requests_cache
+except ImportError:  # Optional: without it every run goes to the network
+    requests_cache = None
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+_CABLECAST_BASE = 'https://reflect-vod-fcgov.cablecast.tv'
+_MUNICODE_BASE = 'https://fortcollins-co.municodemeetings.com'
+
+# On-disk HTTP cache (requests-cache). Show pages rarely change once published,
+# but listing pages gain new meetings, so they are kept fresh.
+_CACHE_NAME = 'fc_scrape_cache'
+_CACHE_EXPIRE_AFTER = timedelta(days=7)
+_CACHE_URLS_EXPIRE_AFTER = {
+    'fortcollins-co.municodemeetings.com': timedelta(hours=1),
+    '*/gallery/*': timedelta(hours=1),
+    '*/search': timedelta(hours=1),
+}
+
+# fetch_page only downloads bodies of HTML pages up to this size
+_HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+_MAX_PAGE_BYTES = 2_000_000
+_GALLERY_PAGE_SIZE = 50
+_TITLE_PROBE_BYTES = 16384  # Leading bytes of a show page read to find its title
+_PAGE_CACHE_SIZE = 512  # Pages kept in memory by fetch_page for reuse within a run
+
+# Steady-state request rate to the network (cache hits are not counted)
+_DEFAULT_REQUESTS_PER_SECOND = 20.0
+_MAX_QUOTA_WAIT = 60.0  # Longest pause taken for a server's rate-limit reset header
+
+# Precompiled patterns shared by the extractors
+_SHOW_RE = re.compile(r'/show/(\d+)')
+_INTERNETCHANNEL_SHOW_RE = re.compile(r'/internetchannel/show/\d+')
+_MP4_HREF_RE = re.compile(r'\.mp4($|\?)', re.I)
+_MP4_URL_BYTES_RE = re.compile(rb'https?://[^"\'\s>]+\.mp4[^"\'\s>]*', re.I)
+# One pass finds every media URL; the named group that matched gives its kind
+_MEDIA_URL_PATTERN = r'https?://[^"\'\s>]+\.(?:(?P<mp4>mp4)|(?P<mpeg>mpeg)|(?P<m3u8>m3u8))[^"\'\s>]*'
+_MEDIA_URL_BYTES_RE = re.compile(_MEDIA_URL_PATTERN.encode(), re.I)
+_MEDIA_EXT_RE = re.compile(r'\.(mp4|mpeg|m3u8)', re.I)
+# Tags scanned for media links and the attribute holding the URL, in candidate order
+_MEDIA_TAG_ATTRS = {'a': 'href', 'source': 'src', 'video': 'src', 'link': 'href', 'meta': 'content'}
+_DATE_RE = re.compile(r'(\d{1,2}/\d{1,2}/\d{2,4})')
+_TIME_RE = re.compile(r'(\d{1,2}:\d{2}\s*[AP]M)', re.I)
+_VIDEO_HREF_RE = re.compile(r'(video|stream|mp4|watch)', re.I)
+_NEXT_LINK_RE = re.compile(r'Next|>', re.I)
+_PAGE_HREF_RE = re.compile(r'page=\d+')
+_PAGINATION_CLASS_RE = re.compile(r'pag', re.I)
+
+_ROWS_ONLY = SoupStrainer('tr')
+# Tags read by the media scan and embed discovery; page bytes cover the <script> text
+_MEDIA_TAGS = ['a', 'source', 'video', 'link', 'meta', 'iframe']
+_MEDIA_ONLY = SoupStrainer(_MEDIA_TAGS)
+# Show pages additionally need the title elements
+_SHOW_PAGE_ONLY = SoupStrainer(_MEDIA_TAGS + ['h1', 'title', 'h2'])
+
+# BeautifulSoup tree builder for every parse in the scraper; lxml's is C-backed
+_PARSER = 'lxml'
+# Output CSV, and the checkpoint rows are appended to while a run is in progress
+_OUTPUT_CSV = 'fort_collins_all_meetings.csv'
+_CHECKPOINT_CSV = 'fort_collins_all_meetings.partial.csv'
+# Column order of the CSV written by save_to_csv
+_CSV_FIELDS = [
+    'date', 'time', 'title', 'meeting_type', 'source', 'agenda_pdf', 'agenda_html',
+    'minutes_pdf', 'minutes_html', 'audio_link', 'video_link', 'mp4_download',
+    'detail_page', 'transcript_url', 'video_id'
+]
+# Municode lists dates as 09/02/2025, Cablecast titles as 8/26/25
+_DATE_FORMATS = ('%m/%d/%Y', '%m/%d/%y')
+
+
+def _categorize_lower(title_lower: str) -> str:
+    """Categorize an already lowercased title."""
+    found = {m.lastgroup for m in _CATEGORY_RE.finditer(title_lower)}
+    # Commission/authority bodies take precedence over City Council variants
+    for body, (qualifier, qualified_label, label) in _BODY_TYPES.items():
+        if body in found:
+            return qualified_label if qualifier in found else label
+    for keyword, label in _COUNCIL_TYPES.items():
+        if keyword in found:
+            return label
+    return 'City Council Meeting'
+
+
+@lru_cache(maxsize=4096)
+def _classify_title(title: str) -> Tuple[bool, str]:
+    """Return ``(is_fort_collins_meeting, meeting_type)``, lowercasing the title once.
+
+    Memoized because the same titles recur across the Municode, gallery,
+    search and ID-sweep phases.
+    """
+    title_lower = title.lower()
+    is_fort_collins = not _EXCLUDE_RE.search(title_lower) and bool(_INCLUDE_RE.search(title_lower))
+    return is_fort_collins, _categorize_lower(title_lower)
+
+
+def _is_page_response(response: requests.Response) -> bool:
+    """Return True when response headers describe an HTML page small enough to read."""
+    content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+    content_length = int(response.headers.get('Content-Length') or 0)
+    return (not content_type or content_type in _HTML_CONTENT_TYPES) and content_length <= _MAX_PAGE_BYTES
+
+
+def _cacheable_response(response: requests.Response) -> bool:
+    """requests-cache filter: keep pages and 404s, never media bodies.
+
+    Saving a response reads its whole body, so without this a streamed GET or
+    probe of an MP4 would download and store the full file.
+    """
+    return response.status_code == 404 or _is_page_response(response)
+
+
+def _parse(content: bytes, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """Parse a fetched page with the C-backed lxml tree builder."""
+    return BeautifulSoup(content, _PARSER, parse_only=parse_only)
+
+
+@lru_cache(maxsize=256)
+def _url_origin(base: str) -> Tuple[str, str]:
+    """Return ``(scheme, 'scheme://netloc')`` for a base URL; pages share a handful of bases."""
+    parts = urlsplit(base)
+    return parts.scheme, f"{parts.scheme}://{parts.netloc}"
+
+
+@lru_cache(maxsize=4096)
+def _cached_urljoin(base: str, href: str) -> str:
+    return urljoin(base, href)
+
+
+def _absolute_url(base: str, href: str) -> str:
+    """Resolve ``href`` against ``base``, skipping urljoin's parsing for the common cases."""
+    if href.startswith(('https://', 'http://')):
+        return href
+    if '/.' not in href:  # Dot segments need urljoin's normalisation
+        if href.startswith('//'):
+            return f"{_url_origin(base)[0]}:{href}"
+        if href.startswith('/'):
+            return _url_origin(base)[1] + href
+    return _cached_urljoin(base, href)
+
+
+def _parse_meeting_date(value: Optional[str]) -> Optional[datetime]:
+    """Parse a scraped meeting date, returning None when it is missing or unrecognised."""
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+# Title filters for is_fort_collins_meeting, each scanned as a single alternation
+_EXCLUDE_TERMS = [
+    # Larimer County and other entities
+    'larimer county', 'larimer co', 'bocc', 'board of county commissioners',
+    'county administrative', 'county planning', 'county land use',
+    'board of social services', 'environmental stewardship'
+]
+_INCLUDE_TERMS = [
+    # Fort Collins governmental bodies of interest
+    'fort collins city council', 'city council', 'fc city council',
+    'fort collins council',
+    'urban renewal authority', 'urban renewal', 'fort collins urban renewal',
+    # New bodies added
+    'historic preservation commission',
+    'historic preservation',
+    'planning & zoning commission',
+    'planning and zoning commission'
+]
+
+
+def _term_pattern(terms: List[str]) -> str:
+    """Build a regex matching any of ``terms`` as a prefix trie.
+
+    Terms containing a shorter term are dropped since only presence matters,
+    and shared prefixes are factored so each title position is tried against
+    one branch per distinct next character rather than every phrase.
+    """
+    terms = [t for t in terms if not any(other != t and other in t for other in terms)]
+    trie: Dict[str, dict] = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[''] = {}  # End of a term; never a prefix of another after the pruning above
+
+    def build(node: Dict[str, dict]) -> str:
+        if '' in node:
+            return ''
+        alts = [re.escape(ch) + build(child) for ch, child in node.items()]
+        return alts[0] if len(alts) == 1 else '(?:' + '|'.join(alts) + ')'
+
+    return build(trie)
+
+
+_EXCLUDE_RE = re.compile(_term_pattern(_EXCLUDE_TERMS))
+_INCLUDE_RE = re.compile(_term_pattern(_INCLUDE_TERMS))
+
+# Category keywords for categorize_meeting_type, found in one scan and resolved
+# through the ordered tables below (earlier entries win)
+_CATEGORY_RE = re.compile(
+    r'(?P<historic>historic preservation)|(?P<planning>planning (?:&|and) zoning)|(?P<urban>urban renewal)'
+    r'|(?P<workshop>workshop)|(?P<work_session>work session)|(?P<regular>regular)|(?P<special>special)'
+    r'|(?P<adjourned>adjourned)'
+)
+_BODY_TYPES = {
+    # body: (qualifier, label when qualified, label otherwise)
+    'historic': ('regular', 'Historic Preservation Commission Regular Meeting', 'Historic Preservation Commission Meeting'),
+    'planning': ('regular', 'Planning & Zoning Commission Regular Meeting', 'Planning & Zoning Commission Meeting'),
+    'urban': ('workshop', 'Urban Renewal Authority Workshop', 'Urban Renewal Authority Board Meeting'),
+}
+_COUNCIL_TYPES = {
+    'regular': 'City Council Regular Meeting',
+    'work_session': 'City Council Work Session',
+    'special': 'City Council Special Meeting',
+    'adjourned': 'City Council Adjourned Meeting',
+}
+
+# Title lookup order used for Cablecast show pages: <h1>, then <title>, then <h2>
+_TITLE_XPATHS = [etree.XPath(f'(//{tag})[1]') for tag in ('h1', 'title', 'h2')]
+
+
+def _lxml_document(content: bytes):
+    """Parse page bytes with raw lxml, decoding them as BeautifulSoup would.
+
+    Left to itself lxml reads a page without a ``<meta charset>`` as Latin-1;
+    taking the first encoding BeautifulSoup's detector offers (declared, then
+    sniffed, then UTF-8) keeps non-ASCII text identical to the soup's.
+    """
+    encoding = next(iter(EncodingDetector(content, is_html=True).encodings), None)
+    return lxml_html.fromstring(content, parser=lxml_html.HTMLParser(encoding=encoding))
+
+
+def _fast_page_title(content: bytes) -> str:
+    """Return a show page title using raw lxml, without building a BeautifulSoup tree."""
+    try:
+        tree = _lxml_document(content)
+    except (etree.ParserError, LookupError, ValueError):
+        return ''
+    for xpath in _TITLE_XPATHS:
+        found = xpath(tree)
+        if found:
+            return found[0].text_content().strip()
+    return ''
+
+
+# Anchors read by the search-results pass, which needs only hrefs and surrounding text
+_ANCHORS_XPATH = etree.XPath('//a[@href]')
+# Elements whose contents BeautifulSoup's get_text leaves out
+_NON_TEXT_TAGS = frozenset(('script', 'style'))
+
+
+def _stripped_text(element) -> str:
+    """Join an lxml element's text the way BeautifulSoup's ``get_text(strip=True)`` does."""
+    parts = []
+    for node in element.iter():
+        # Comments have a non-string tag; like script and style, only their tail is text
+        if node.text and isinstance(node.tag, str) and node.tag not in _NON_TEXT_TAGS:
+            parts.append(node.text.strip())
+        if node is not element and node.tail:
+            parts.append(node.tail.strip())
+    return ''.join(parts)
+
+
+def _listing_links(content: bytes) -> List[Tuple[str, str]]:
+    """Return ``(href, parent text)`` for every anchor in a page, using raw lxml."""
+    try:
+        tree = _lxml_document(content)
+    except (etree.ParserError, LookupError, ValueError):
+        return []
+    links = []
+    for anchor in _ANCHORS_XPATH(tree):
+        parent = anchor.getparent()
+        links.append((anchor.get('href'), _stripped_text(parent if parent is not None else anchor)))
+    return links
+
+
+class _TokenBucket:
+    """Thread-safe token bucket allowing ``rate`` requests per second, bursting up to ``rate``."""
+
+    def __init__(self, rate: float) -> None:
+        self.rate = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve the token under the lock, then wait outside it so other threads queue behind
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+    def hold(self, seconds: float) -> None:
+        """Hand out no tokens for the next ``seconds``, e.g. while a server quota resets."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+def _quota_reset_delay(headers) -> Optional[float]:
+    """Seconds to wait when rate-limit headers say the quota is spent, else None.
+
+    ``X-RateLimit-Reset`` may be a delay or an epoch timestamp; ``Retry-After``
+    is used when it is absent. The wait is capped so a bad header cannot stall a run.
+    """
+    if headers.get('X-RateLimit-Remaining', '').strip() != '0':
+        return None
+    value = headers.get('X-RateLimit-Reset') or headers.get('Retry-After')
+    try:
+        delay = float(value)
+    except (TypeError, ValueError):
+        return None
+    if delay > 1e9:  # Epoch seconds
+        delay -= time.time()
+    return min(max(delay, 0.0), _MAX_QUOTA_WAIT)
+
+
+class _ThrottledAdapter(HTTPAdapter):
+    """HTTPAdapter that takes a limiter token before every request it sends.
+
+    When a response reports an exhausted server quota, the limiter is held
+    until the quota resets, so every worker backs off together.
+    """
+
+    def __init__(self, limiter: _TokenBucket, **kwargs) -> None:
+        self._limiter = limiter
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        self._limiter.acquire()
+        response = super().send(request, **kwargs)
+        delay = _quota_reset_delay(response.headers)
+        if delay:
+            logger.info("Server quota spent; pausing requests for %.1fs", delay)
+            self._limiter.hold(delay)
+        return response
+
+
+def _retry_policy() -> Retry:
+    """Retry connection errors and 429/5xx responses with backoff, honouring Retry-After.
+
+    Backoff is jittered where urllib3 supports it (2.x), so workers that failed
+    together do not retry in lockstep.
+    """
+    options = dict(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                   respect_retry_after_header=True, raise_on_status=False)
+    try:
+        return Retry(backoff_jitter=0.5, **options)
+    except TypeError:
+        return Retry(**options)
+
 
 class FortCollinsVideoScraper:
     """Scrape meeting metadata, video links and transcripts for Fort Collins city bodies."""
 
-    def __init__(self) -> None:
+    def __init__(self, max_workers: int = 16,
+                 requests_per_second: float = _DEFAULT_REQUESTS_PER_SECOND,
+                 use_cache: bool = True) -> None:
         # Multiple sources for Fort Collins videos
         self.sources = {
-            'municode_meetings': 'https://fortcollins-co.municodemeetings.com',
+            'municode_meetings': _MUNICODE_BASE,
             'cablecast_archive': 'https://www.fcgov.com/fctv/video-archive',
-            'cablecast_api': 'https://reflect-vod-fcgov.cablecast.tv'
+            'cablecast_api': _CABLECAST_BASE
         }
 
-        self.session = requests.Session()
+        if use_cache and requests_cache is not None:
+            # 404s are cached too, so repeat sweeps skip known-missing show IDs;
+            # HEAD probes are cached alongside GETs, and an expired page is
+            # served stale rather than lost if the server errors on revalidation
+            self.session = requests_cache.CachedSession(
+                _CACHE_NAME,
+                expire_after=_CACHE_EXPIRE_AFTER,
+                urls_expire_after=_CACHE_URLS_EXPIRE_AFTER,
+                allowable_codes=(200, 404),
+                allowable_methods=('GET', 'HEAD'),
+                stale_if_error=True,
+                filter_fn=_cacheable_response,
+            )
+            # requests-cache reads a 200 body in full to store it, so a partial read saves nothing
+            self._probe_titles = False
+        else:
+            self.session = requests.Session()
+            self._probe_titles = True
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
 
+        # Keep one keep-alive connection per page worker and per probe worker so
+        # concurrent fetches to the single Cablecast host reuse TCP/TLS sessions
+        # instead of discarding them. The adapter also paces requests (cached
+        # responses never reach it) and retries transient failures.
+        self._limiter = _TokenBucket(requests_per_second)
+        adapter = _ThrottledAdapter(self._limiter, pool_maxsize=max(2 * max_workers, 10),
+                                    max_retries=_retry_policy())
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
         self.meetings_data = []
-        self.processed_urls = set()  # Track processed videos to avoid duplicates
+        # Dedup keys: (date, title) for added meetings, ('gallery', id, title) for gallery tiles
+        self.processed_urls: set = set()
+        self.max_workers = max_workers
+        self._transcript_probes: Dict[str, bool] = {}  # Transcript URL -> exists
+        self._seen_video_ids: set = set()  # Cablecast show IDs whose page has been extracted
+        self._page_cache: 'OrderedDict[str, requests.Response]' = OrderedDict()  # URL -> fetched page
+        self._page_cache_lock = threading.Lock()
+        # Short HEAD probes are submitted here from inside page workers, so they
+        # overlap without waiting for a slot in the page pools. Started on first
+        # use by _probe_executor and shut down when a run ends.
+        self._probe_pool: Optional[ThreadPoolExecutor] = None
+        self._probe_pool_lock = threading.Lock()
+        # Open while a run is in progress; _add_meeting appends each new meeting
+        self._checkpoint_path: Optional[str] = None
+        self._checkpoint_file = None
+        self._checkpoint_writer: Optional[csv.DictWriter] = None
+
+    def _probe_executor(self) -> ThreadPoolExecutor:
+        """Return the shared HEAD-probe pool, starting it if no run has one open."""
+        with self._probe_pool_lock:
+            if self._probe_pool is None:
+                self._probe_pool = ThreadPoolExecutor(max_workers=self.max_workers)
+            return self._probe_pool
+
+    def _shutdown_probe_executor(self) -> None:
+        """Stop the HEAD-probe pool; the next probe starts a fresh one."""
+        with self._probe_pool_lock:
+            pool, self._probe_pool = self._probe_pool, None
+        if pool is not None:
+            pool.shutdown()
+
+    def fetch_page(self, url: str):
+        """Fetch an HTML page, returning None on failure.
+
+        Transient errors are retried by the session's adapter (see _retry_policy).
+        The body is streamed so that non-HTML or oversized responses can be
+        dropped after the headers arrive; those return None without retrying.
+        Successful pages are kept in a small in-memory LRU, so detail pages
+        shared by several meetings or revisited by a later phase are not
+        fetched again.
+        """
+        with self._page_cache_lock:
+            cached = self._page_cache.get(url)
+            if cached is not None:
+                self._page_cache.move_to_end(url)
+                return cached
+        try:
+            response = self.session.get(url, timeout=30, stream=True)
+            response.raise_for_status()
+            if not _is_page_response(response):
+                logger.debug("Skipping %s: %s, %s bytes", url, response.headers.get('Content-Type') or 'unknown type',
+                             response.headers.get('Content-Length') or 'unknown')
+                response.close()
+                return None
+            response.content  # Read the body now that it is wanted
+        except requests.RequestException as e:
+            if e.response is not None:
+                e.response.close()
+            logger.warning("Failed to fetch %s: %s", url, e)
+            return None
+        with self._page_cache_lock:
+            self._page_cache[url] = response
+            if len(self._page_cache) > _PAGE_CACHE_SIZE:
+                self._page_cache.popitem(last=False)
+        return response
+
+    def _fetch_many(self, urls: List[str]) -> List[Tuple[str, Optional[requests.Response]]]:
+        """Fetch several pages concurrently, returning (url, response) pairs in input order."""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(zip(urls, executor.map(self.fetch_page, urls)))
+
+    def _known_from_listing(self, title_text: str) -> bool:
+        """Return True when a listing title already identifies a recorded meeting.
+
+        Show pages take their date from the title, so a dated listing title that
+        matches a recorded (date, title) key needs no show-page fetch.
+        """
+        date_match = _DATE_RE.search(title_text)
+        return bool(date_match) and (date_match.group(1), title_text) in self.processed_urls
 
-    def fetch_page(self, url: str, max_retries: int = 3):
-        """Fetch a page with retry logic."""
-        for attempt in range(max_retries):
+    def _add_meeting(self, meeting_data: Dict[str, str]) -> bool:
+        """Append a meeting unless one with the same date and title was already added."""
+        key = (meeting_data['date'], meeting_data['title'])
+        if key in self.processed_urls:
+            return False
+        self.processed_urls.add(key)
+        self.meetings_data.append(meeting_data)
+        if self._checkpoint_writer is not None:
+            self._checkpoint_writer.writerow(meeting_data)
+            self._checkpoint_file.flush()
+        return True
+
+    def _open_checkpoint(self, filename: str = _CHECKPOINT_CSV) -> None:
+        """Start a checkpoint CSV that receives each meeting as it is found.
+
+        Rows are written unsorted and before enhancement; the checkpoint only
+        guards against losing a crashed run and is removed by save_to_csv.
+        A checkpoint left by an interrupted run is loaded back and appended to,
+        so its meetings are kept and their shows are not fetched again.
+        """
+        unsaved = list(self.meetings_data)
+        recovered = self._load_checkpoint(filename)
+        self._checkpoint_path = filename
+        self._checkpoint_file = open(filename, 'a' if recovered else 'w', newline='', encoding='utf-8')
+        self._checkpoint_writer = csv.DictWriter(self._checkpoint_file, fieldnames=_CSV_FIELDS,
+                                                 restval='', extrasaction='ignore')
+        if not recovered:
+            self._checkpoint_writer.writeheader()
+        self._checkpoint_writer.writerows(unsaved)
+        self._checkpoint_file.flush()
+
+    def _load_checkpoint(self, filename: str) -> int:
+        """Add the meetings saved in an earlier run's checkpoint, returning how many were read."""
+        try:
+            with open(filename, newline='', encoding='utf-8') as f:
+                rows = list(csv.DictReader(f))
+        except FileNotFoundError:
+            return 0
+        except (OSError, csv.Error) as e:
+            logger.warning("Ignoring unreadable checkpoint %s: %s", filename, e)
+            return 0
+        recovered = 0
+        for row in rows:
+            if row.get('date') is None or row.get('title') is None:
+                continue
+            # The row's (date, title) key and show ID let listings and the sweep skip it
+            if self._add_meeting(row):
+                recovered += 1
+                if (row.get('video_id') or '').isdigit():
+                    self._seen_video_ids.add(int(row['video_id']))
+        if recovered:
+            logger.info("Recovered %d meetings from checkpoint %s", recovered, filename)
+        return recovered
+
+    def _close_checkpoint(self, remove: bool) -> None:
+        """Stop appending to the checkpoint CSV, deleting it once a full save has superseded it."""
+        if self._checkpoint_file is not None:
+            self._checkpoint_file.close()
+            self._checkpoint_file = None
+            self._checkpoint_writer = None
+        if remove and self._checkpoint_path:
             try:
-                response = self.session.get(url, timeout=30)
-                response.raise_for_status()
-                return response
-            except requests.RequestException as e:
-                logger.warning(f"Attempt {attempt + 1} failed for {url}: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
-                else:
-                    logger.error(f"Failed to fetch {url} after {max_retries} attempts")
-                    return None
+                os.remove(self._checkpoint_path)
+            except OSError as e:
+                logger.debug("Could not remove checkpoint %s: %s", self._checkpoint_path, e)
+            self._checkpoint_path = None
 
-    def _extract_media_urls_from_html(self, soup: BeautifulSoup, base_url: str) -> Dict[str, List[str]]:
-        """Extract media URLs from common HTML elements and script text.
+    def _extract_media_urls_from_html(self, soup: BeautifulSoup, base_url: str,
+                                      raw_body: bytes) -> Dict[str, List[str]]:
+        """Extract media URLs from common HTML elements and the raw page bytes.
+
+        ``raw_body`` (the page's response bytes) is scanned directly for script
+        and inline URLs, so no element text is decoded or joined.
 
         Returns a dict with keys: mp4, mpeg, m3u8 containing URL lists.
         """
-        media: Dict[str, List[str]] = {'mp4': [], 'mpeg': [], 'm3u8': []}
+        # Dicts act as insertion-ordered sets so repeated URLs cost one hash lookup
+        media: Dict[str, Dict[str, None]] = {'mp4': {}, 'mpeg': {}, 'm3u8': {}}
 
         def add_url(kind: str, url_val: str) -> None:
             if not url_val:
                 return
             if not url_val.startswith('http'):
-                url_val = urljoin(base_url, url_val)
-            if url_val not in media[kind]:
-                media[kind].append(url_val)
-
-        # Elements with src/href
-        for tag_name, attr in [('a', 'href'), ('source', 'src'), ('video', 'src'), ('link', 'href')]:
-            for tag in soup.find_all(tag_name):
-                val = tag.get(attr, '')
-                if not val:
-                    continue
-                low = val.lower()
-                if '.mp4' in low:
-                    add_url('mp4', val)
-                if '.mpeg' in low:
-                    add_url('mpeg', val)
-                if '.m3u8' in low:
-                    add_url('m3u8', val)
-
-        # Meta video
-        for meta in soup.find_all('meta'):
-            prop = (meta.get('property') or meta.get('name') or '').lower()
-            if 'video' in prop:
-                content = meta.get('content', '')
-                if '.mp4' in (content or '').lower():
-                    add_url('mp4', content)
-
-        # Script text scanning
-        combined_script = '\n'.join([s.get_text(' ', strip=False) for s in soup.find_all('script')])
-        if combined_script:
-            for pattern, kind in [
-                (r'https?://[^"\'\s>]+\.mp4[^"\'\s>]*', 'mp4'),
-                (r'https?://[^"\'\s>]+\.mpeg[^"\'\s>]*', 'mpeg'),
-                (r'https?://[^"\'\s>]+\.m3u8[^"\'\s>]*', 'm3u8'),
-            ]:
-                try:
-                    for match in re.findall(pattern, combined_script, flags=re.IGNORECASE):
-                        add_url(kind, match)
-                except re.error:
-                    continue
+                url_val = _absolute_url(base_url, url_val)
+            media[kind].setdefault(url_val, None)
+
+        # Elements with src/href and video meta tags, gathered in one tree walk. Hits are
+        # bucketed per tag so candidates keep their a, source, video, link, meta order.
+        buckets: Dict[str, List[str]] = {name: [] for name in _MEDIA_TAG_ATTRS}
+        for tag in soup.find_all(list(_MEDIA_TAG_ATTRS)):
+            val = tag.get(_MEDIA_TAG_ATTRS[tag.name])
+            if not val:
+                continue
+            if tag.name == 'meta' and 'video' not in (tag.get('property') or tag.get('name') or '').lower():
+                continue
+            buckets[tag.name].append(val)
+        for name, values in buckets.items():
+            for val in values:
+                # One scan finds every media extension in the value
+                for ext in _MEDIA_EXT_RE.findall(val):
+                    kind = ext.lower()
+                    if name != 'meta' or kind == 'mp4':
+                        add_url(kind, val)
 
-        return media
+        # Script and inline URLs, scanned in the undecoded body
+        for match in _MEDIA_URL_BYTES_RE.finditer(raw_body):
+            add_url(match.lastgroup, html.unescape(match.group().decode('utf-8', 'ignore')))
+
+        return {kind: list(urls) for kind, urls in media.items()}
 
     def _follow_embeds_and_players(self, page_url: str, soup: BeautifulSoup, video_id: Optional[int]) -> Dict[str, List[str]]:
-        """Follow iframes/player links likely to contain direct media URLs and aggregate results."""
-        aggregated: Dict[str, List[str]] = {'mp4': [], 'mpeg': [], 'm3u8': []}
+        """Follow iframes/player links likely to contain direct media URLs and aggregate results.
+
+        Candidates are followed in order until one yields an MP4.
+        """
+        aggregated: Dict[str, Dict[str, None]] = {'mp4': {}, 'mpeg': {}, 'm3u8': {}}
 
         def merge(found: Dict[str, List[str]]):
-            for k in aggregated.keys():
-                for u in found.get(k, []):
-                    if u not in aggregated[k]:
-                        aggregated[k].append(u)
+            for k, urls in aggregated.items():
+                urls.update(dict.fromkeys(found.get(k, [])))
 
         # Discover iframe/player links from current soup
         candidate_links: List[str] = []
-        for iframe in soup.find_all(['iframe']):
-            src = iframe.get('src', '')
-            if src:
-                candidate_links.append(urljoin(page_url, src))
+        for iframe in soup.find_all('iframe', src=True):
+            candidate_links.append(_absolute_url(page_url, iframe['src']))
         # Anchor links that look like players or embeds
-        for a in soup.find_all('a'):
-            href = a.get('href', '')
-            if href and any(token in href.lower() for token in ['embed', 'iframe', 'player']):
-                candidate_links.append(urljoin(page_url, href))
+        for a in soup.find_all('a', href=True):
+            href = a['href']
+            if any(token in href.lower() for token in ['embed', 'iframe', 'player']):
+                candidate_links.append(_absolute_url(page_url, href))
 
         # Try common Cablecast embed patterns by ID if known
         if video_id is not None:
             embed_candidates = [
-                f"https://reflect-vod-fcgov.cablecast.tv/CablecastPublicSite/resource/embed/iframe?show={video_id}&site=1",
-                f"https://reflect-vod-fcgov.cablecast.tv/internetchannel/embed?show={video_id}&site=1",
-                f"https://reflect-vod-fcgov.cablecast.tv/internetchannel/resource/embed/iframe?show={video_id}&site=1",
+                f"{_CABLECAST_BASE}/CablecastPublicSite/resource/embed/iframe?show={video_id}&site=1",
+                f"{_CABLECAST_BASE}/internetchannel/embed?show={video_id}&site=1",
+                f"{_CABLECAST_BASE}/internetchannel/resource/embed/iframe?show={video_id}&site=1",
             ]
             candidate_links.extend(embed_candidates)
 
@@ -181,25 +696,54 @@ class FortCollinsVideoScraper:
                 resp = self.fetch_page(url)
                 if not resp:
                     continue
-                child_soup = BeautifulSoup(resp.content, 'html.parser')
-                media = self._extract_media_urls_from_html(child_soup, url)
+                child_soup = _parse(resp.content, _MEDIA_ONLY)
+                media = self._extract_media_urls_from_html(child_soup, url, resp.content)
                 merge(media)
             except Exception as e:
-                logger.debug(f"Error following embed {url}: {e}")
+                logger.debug("Error following embed %s: %s", url, e)
+            if aggregated['mp4']:
+                # Callers take the first MP4, so later candidates cannot change the outcome
+                break
 
-        return aggregated
+        return {kind: list(urls) for kind, urls in aggregated.items()}
+
+    def _exists(self, url: str) -> bool:
+        """Return True when a non-empty file is served at the URL.
+
+        Uses a one-byte ranged GET rather than HEAD: CDN origins often reject
+        HEAD or omit Content-Length on it, while a 206 answer settles it in
+        one round trip.
+        """
+        try:
+            with self.session.get(url, stream=True, headers={'Range': 'bytes=0-0'},
+                                  timeout=10, allow_redirects=True) as response:
+                if response.status_code == 206:
+                    return True  # An empty file would answer 416
+                return response.status_code == 200 and int(response.headers.get('Content-Length') or 0) > 0
+        except Exception:
+            return False
+
+    def _mp4_from_hls(self, m3u8_urls: List[str], video_id: Optional[int]) -> Optional[str]:
+        """Derive an MP4 sibling for each HLS playlist and return the best one that exists.
+
+        All candidates are probed at once on the shared probe pool; the answer
+        still follows preference order, best-scored playlist first.
+        """
+        best = self._pick_best_media_for_id(m3u8_urls, video_id)
+        ordered = [best] + m3u8_urls if best else m3u8_urls
+        candidates = list(dict.fromkeys(u.split('?', 1)[0].rsplit('.', 1)[0] + '.mp4' for u in ordered))
+        exists = list(self._probe_executor().map(self._exists, candidates))
+        return next((c for c, ok in zip(candidates, exists) if ok), None)
 
     def _pick_best_media_for_id(self, candidates: List[str], video_id: Optional[int]) -> Optional[str]:
         """Pick the most likely direct media URL for a specific show ID."""
         if not candidates:
             return None
-        # Deduplicate preserving order
-        unique = []
-        seen = set()
-        for u in candidates:
-            if u not in seen:
-                unique.append(u)
-                seen.add(u)
+        # Build the per-ID probe strings once rather than for every candidate
+        if video_id is not None:
+            vid_str = str(int(video_id))
+            id_dash, id_underscore, id_dir = f"/{vid_str}-", f"/{vid_str}_", f"/{vid_str}/"
+            show_param = f"show={vid_str}"
 
         def score(url: str) -> int:
             s = 0
@@ -208,25 +752,21 @@ class FortCollinsVideoScraper:
                 if parsed.netloc.endswith('cablecast.tv'):
                     s += 1
                 if video_id is not None:
-                    vid_str = str(int(video_id))
                     path = parsed.path or ''
                     query = parsed.query or ''
-                    if f"/{vid_str}-" in path or f"/{vid_str}_" in path or f"/{vid_str}/" in path:
+                    if id_dash in path or id_underscore in path or id_dir in path:
                         s += 6
-                    if f"show={vid_str}" in query:
+                    if show_param in query:
                         s += 3
                     # Common store pattern: /store-X/<id>-Title/vod.mp4
-                    if '/store-' in path and f"/{vid_str}-" in path:
+                    if '/store-' in path and id_dash in path:
                         s += 4
             except Exception:
                 pass
             return s
 
-        best = max(unique, key=score)
-        # If all scores are zero, fall back to the first candidate
-        if score(best) == 0:
-            return unique[0]
-        return best
+        # Each unique URL is scored once; ties (including all-zero scores) keep the earliest candidate
+        return max(dict.fromkeys(candidates), key=score)
 
     def is_fort_collins_meeting(self, title: str) -> bool:
         """
@@ -236,29 +776,11 @@ class FortCollinsVideoScraper:
         include Historic Preservation and Planning & Zoning commissions.  It
         still excludes Larimer County and other non‑Fort Collins entities.
         """
-        title_lower = title.lower()
+        return _classify_title(title)[0]
 
-        # Exclude Larimer County and other entities
-        exclude_terms = [
-            'larimer county', 'larimer co', 'bocc', 'board of county commissioners',
-            'county administrative', 'county planning', 'county land use',
-            'board of social services', 'environmental stewardship'
-        ]
-        if any(term in title_lower for term in exclude_terms):
-            return False
-
-        # Include Fort Collins governmental bodies of interest
-        include_terms = [
-            'fort collins city council', 'city council', 'fc city council',
-            'fort collins council',
-            'urban renewal authority', 'urban renewal', 'fort collins urban renewal',
-            # New bodies added
-            'historic preservation commission',
-            'historic preservation',
-            'planning & zoning commission',
-            'planning and zoning commission'
-        ]
-        return any(term in title_lower for term in include_terms)
+    def _classify(self, title: str) -> Tuple[bool, str]:
+        """Return ``(is_fort_collins_meeting, meeting_type)`` for a title."""
+        return _classify_title(title)
 
     def scrape_municode_meetings(self):
         """Scrape meeting information from the Municode meetings portal."""
@@ -266,31 +788,38 @@ class FortCollinsVideoScraper:
         response = self.fetch_page(self.sources['municode_meetings'])
         if not response:
             return
-        soup = BeautifulSoup(response.content, 'html.parser')
+        # Only table rows are used, so skip building the rest of the document
+        soup = _parse(response.content, _ROWS_ONLY)
         meeting_rows = soup.find_all('tr')
         for row in meeting_rows:
             try:
-                meeting_data = self.extract_municode_meeting_data(row)
-                if meeting_data and self.is_fort_collins_meeting(meeting_data['title']):
-                    unique_key = f"{meeting_data['date']}_{meeting_data['title']}"
-                    if unique_key not in self.processed_urls:
-                        self.meetings_data.append(meeting_data)
-                        self.processed_urls.add(unique_key)
-                        logger.info(f"Added (municode): {meeting_data['title']} - {meeting_data['date']}")
+                meeting_data = self.extract_municode_meeting_data(row, fort_collins_only=True)
+                if meeting_data and self._add_meeting(meeting_data):
+                    logger.info("Added (municode): %s - %s", meeting_data['title'], meeting_data['date'])
             except Exception as e:
-                logger.warning(f"Error parsing municode row: {e}")
+                logger.warning("Error parsing municode row: %s", e)
                 continue
 
-    def extract_municode_meeting_data(self, row) -> Optional[Dict[str, str]]:
-        """Extract meeting data from Municode table row."""
+    def extract_municode_meeting_data(self, row, fort_collins_only: bool = False) -> Optional[Dict[str, str]]:
+        """Extract meeting data from a Municode table row, or None when the row has no title.
+
+        With ``fort_collins_only`` the title is classified first and rows outside
+        the bodies of interest also return None, before any links are read.
+        """
         cells = row.find_all('td')
         if len(cells) < 2:
             return None
+        title = cells[1].get_text(strip=True)
+        if not title:
+            return None
+        is_fort_collins, meeting_type = self._classify(title)
+        if fort_collins_only and not is_fort_collins:
+            return None
         meeting_data: Dict[str, str] = {
             'date': '',
             'time': '',
-            'title': '',
-            'meeting_type': '',
+            'title': title,
+            'meeting_type': meeting_type,
             'source': 'municode',
             'agenda_pdf': '',
             'agenda_html': '',
@@ -303,41 +832,32 @@ class FortCollinsVideoScraper:
             'transcript_url': ''
         }
         # Extract date and time
-        date_time_cell = cells[0] if cells else None
-        if date_time_cell:
-            date_time_text = date_time_cell.get_text(strip=True)
-            if ' - ' in date_time_text:
-                date_part, time_part = date_time_text.split(' - ', 1)
-                meeting_data['date'] = date_part.strip()
-                meeting_data['time'] = time_part.strip()
-        # Extract title and categorize
-        title_cell = cells[1] if len(cells) > 1 else None
-        if title_cell:
-            meeting_data['title'] = title_cell.get_text(strip=True)
-            meeting_data['meeting_type'] = self.categorize_meeting_type(meeting_data['title'])
+        date_time_text = cells[0].get_text(strip=True)
+        if ' - ' in date_time_text:
+            date_part, time_part = date_time_text.split(' - ', 1)
+            meeting_data['date'] = date_part.strip()
+            meeting_data['time'] = time_part.strip()
         # Extract links for video/audio/documents
-        for cell in cells:
-            links = cell.find_all('a')
-            images = cell.find_all('img')
-            for link in links:
-                href = link.get('href', '')
-                if href and 'view details' in link.get_text(strip=True).lower():
-                    meeting_data['detail_page'] = urljoin(self.sources['municode_meetings'], href)
-            for img in images:
-                src = img.get('src', '')
-                parent_link = img.find_parent('a')
-                if parent_link:
-                    href = parent_link.get('href', '')
-                    if href:
-                        full_url = urljoin(self.sources['municode_meetings'], href)
-                        if 'video' in src:
-                            meeting_data['video_link'] = full_url
-                        elif 'pdf' in src:
-                            if not meeting_data['agenda_pdf']:
-                                meeting_data['agenda_pdf'] = full_url
-                            else:
-                                meeting_data['minutes_pdf'] = full_url
-        return meeting_data if meeting_data['title'] else None
+        # Walk the row's anchors in one search and classify each by its text and any
+        # icon images inside it; images are looked up from their anchor, never upwards
+        for link in row.find_all('a', href=True):
+            href = link['href']
+            if not href:
+                continue
+            full_url = _absolute_url(_MUNICODE_BASE, href)
+            # A leaf anchor's single string answers without a get_text walk
+            if 'view details' in (link.string or link.get_text(strip=True)).lower():
+                meeting_data['detail_page'] = full_url
+            for img in link.find_all('img', src=True):
+                src = img['src']
+                if 'video' in src:
+                    meeting_data['video_link'] = full_url
+                elif 'pdf' in src:
+                    if not meeting_data['agenda_pdf']:
+                        meeting_data['agenda_pdf'] = full_url
+                    else:
+                        meeting_data['minutes_pdf'] = full_url
+        return meeting_data
 
     def scrape_cablecast_videos(self):
         """Scrape Fort Collins videos from the Cablecast platform using galleries and search."""
@@ -365,9 +885,15 @@ class FortCollinsVideoScraper:
             "Planning & Zoning Commission Regular Meeting",
             "Planning and Zoning Commission"
         ]
-        for search_term in search_terms:
-            self.search_cablecast_videos(search_term)
-            time.sleep(2)  # polite delay
+        # Fetch every search results page concurrently, then parse them in order
+        search_urls = [url for term in search_terms for url in self._cablecast_search_urls(term)]
+        for search_url, response in self._fetch_many(search_urls):
+            if not response:
+                continue
+            try:
+                self.extract_cablecast_videos_from_page(response.content)
+            except Exception as e:
+                logger.warning("Error searching Cablecast (%s): %s", search_url, e)
 
     def scrape_cablecast_galleries(self):
         """Scrape videos from the organized Cablecast galleries."""
@@ -379,59 +905,78 @@ class FortCollinsVideoScraper:
         ]
         
         for gallery in galleries:
-            logger.info(f"Scraping gallery: {gallery['name']} (ID {gallery['id']})")
-            self.scrape_single_gallery(gallery['id'], gallery['name'])
-            time.sleep(2)
-
-    def scrape_single_gallery(self, gallery_id: int, gallery_name: str):
-        """Scrape all pages of a single gallery."""
+            logger.info("Scraping gallery: %s (ID %s)", gallery['name'], gallery['id'])
+            self.scrape_single_gallery(gallery['id'], gallery['name'], gallery['total_expected'])
+
+    def _gallery_page_url(self, gallery_id: int, page: int) -> str:
+        """Build the URL of one page of a Cablecast gallery."""
+        if page == 1:
+            return f"{_CABLECAST_BASE}/internetchannel/gallery/{gallery_id}?site=1"
+        offset = (page - 1) * _GALLERY_PAGE_SIZE
+        return (f"{_CABLECAST_BASE}/internetchannel/gallery/{gallery_id}?page={page}&fullText=null"
+                f"&page_size={_GALLERY_PAGE_SIZE}&offset={offset}&site=1")
+
+    def scrape_single_gallery(self, gallery_id: int, gallery_name: str, total_expected: Optional[int] = None):
+        """Scrape all pages of a single gallery.
+
+        When ``total_expected`` is given, the ``ceil(total / 50)`` pages it
+        implies are fetched concurrently and all processed without probing for
+        pagination links. Only after the last of them (or from the first page,
+        when no total is known) is pagination followed one page at a time,
+        while pages keep yielding new videos and a next link.
+        """
         page = 1
         videos_found = 0
-        
+        num_pages = math.ceil(total_expected / _GALLERY_PAGE_SIZE) if total_expected else 0
+        prefetched: Dict[int, Optional[requests.Response]] = {}
+        if num_pages:
+            urls = [self._gallery_page_url(gallery_id, n) for n in range(1, num_pages + 1)]
+            logger.info("Prefetching %s page(s) of %s", num_pages, gallery_name)
+            prefetched = {n: response for n, (_, response) in enumerate(self._fetch_many(urls), start=1)}
+
         while True:
-            # Construct gallery URL with pagination
-            if page == 1:
-                url = f"https://reflect-vod-fcgov.cablecast.tv/internetchannel/gallery/{gallery_id}?site=1"
+            if page in prefetched:
+                response = prefetched.pop(page)
             else:
-                offset = (page - 1) * 50
-                url = f"https://reflect-vod-fcgov.cablecast.tv/internetchannel/gallery/{gallery_id}?page={page}&fullText=null&page_size=50&offset={offset}&site=1"
-            
-            logger.info(f"Fetching {gallery_name} page {page}: {url}")
-            response = self.fetch_page(url)
-            
+                url = self._gallery_page_url(gallery_id, page)
+                logger.info("Fetching %s page %s: %s", gallery_name, page, url)
+                response = self.fetch_page(url)
+
+            soup = None
+            page_videos: List[Dict] = []
             if not response:
-                logger.warning(f"Failed to fetch {gallery_name} page {page}")
-                break
-                
-            soup = BeautifulSoup(response.content, 'html.parser')
-            page_videos = self.extract_gallery_videos(soup, gallery_id)
-            
+                logger.warning("Failed to fetch %s page %s", gallery_name, page)
+            else:
+                soup = _parse(response.content)
+                page_videos = self.extract_gallery_videos(soup, gallery_id)
+                videos_found += len(page_videos)
+                logger.info("Found %d videos on %s page %s", len(page_videos), gallery_name, page)
+
+            if page < num_pages:
+                page += 1
+                continue
             if not page_videos:
-                logger.info(f"No videos found on {gallery_name} page {page}, stopping pagination")
+                logger.info("No videos found on %s page %s, stopping pagination", gallery_name, page)
                 break
-                
-            videos_found += len(page_videos)
-            logger.info(f"Found {len(page_videos)} videos on {gallery_name} page {page}")
-            
-            # Check if there are more pages by looking for pagination elements
-            has_next_page = self.has_next_page(soup)
-            if not has_next_page:
+            # Past the declared total, keep going only while the gallery links to more pages
+            if not self.has_next_page(soup):
                 break
-                
             page += 1
-            time.sleep(1)  # Be polite
-            
-        logger.info(f"Gallery {gallery_name} complete: {videos_found} videos found")
+
+        logger.info("Gallery %s complete: %s videos found", gallery_name, videos_found)
 
     def extract_gallery_videos(self, soup: BeautifulSoup, gallery_id: int) -> List[Dict]:
         """Extract video data from a gallery page."""
         videos_found = []
+        tiles: Dict[Tuple[str, int, str], Tuple[int, str]] = {}  # Dedup key -> (video id, show URL)
         
         # Look for video links in the gallery page
-        video_links = soup.find_all('a', href=re.compile(r'/internetchannel/show/\d+'))
+        # Match hrefs as plain strings rather than via find_all's per-node regex callback
+        show_links = [a for a in soup.find_all('a', href=True) if _SHOW_RE.search(a['href'])]
+        video_links = [a for a in show_links if _INTERNETCHANNEL_SHOW_RE.search(a['href'])]
         if not video_links:
             # Alternative: look for any show links
-            video_links = soup.find_all('a', href=re.compile(r'/show/\d+'))
+            video_links = show_links
             
         for link in video_links:
             href = link.get('href', '')
@@ -439,12 +984,14 @@ class FortCollinsVideoScraper:
                 continue
                 
             # Extract video ID
-            video_id_match = re.search(r'/show/(\d+)', href)
+            video_id_match = _SHOW_RE.search(href)
             if not video_id_match:
                 continue
                 
             video_id = int(video_id_match.group(1))
-            
+            if video_id in self._seen_video_ids:
+                continue
+
             # Get title from link text or nearby elements
             title_text = link.get_text(strip=True)
             if not title_text:
@@ -457,46 +1004,50 @@ class FortCollinsVideoScraper:
                 continue
                 
             # Build full URL
-            if href.startswith('/'):
-                full_url = f"https://reflect-vod-fcgov.cablecast.tv{href}"
-            else:
-                full_url = href
+            full_url = _absolute_url(_CABLECAST_BASE, href)
                 
             # Add site parameter if not present
             if '?site=1' not in full_url and '&site=1' not in full_url:
                 separator = '&' if '?' in full_url else '?'
                 full_url += f"{separator}site=1"
                 
-            # Fetch the individual video page to get full metadata
-            unique_key = f"gallery_{video_id}_{title_text}"
-            if unique_key not in self.processed_urls:
-                video_response = self.fetch_page(full_url)
-                if video_response:
-                    video_soup = BeautifulSoup(video_response.content, 'html.parser')
-                    meeting_data = self.extract_cablecast_video_data(video_soup, full_url, video_id)
-                    if meeting_data:
-                        self.meetings_data.append(meeting_data)
-                        self.processed_urls.add(unique_key)
+            unique_key = ('gallery', video_id, title_text)
+            if unique_key in self.processed_urls:
+                continue
+            if self._known_from_listing(title_text):
+                logger.debug("Skipping show %s: already recorded as %s", video_id, title_text)
+                continue
+            tiles.setdefault(unique_key, (video_id, full_url))
+
+        # Fetch the individual video pages together to get full metadata
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = executor.map(lambda tile: self._fetch_cablecast_show(*tile), tiles.values())
+            for unique_key, meeting_data in zip(tiles, results):
+                if meeting_data:
+                    self.processed_urls.add(unique_key)
+                    # _add_meeting also registers the (date, title) key so other listings can skip this show
+                    if self._add_meeting(meeting_data):
                         videos_found.append(meeting_data)
-                        logger.info(f"Added from gallery {gallery_id}: {meeting_data['title']}")
-                time.sleep(0.5)  # Be polite
-                
+                        logger.info("Added from gallery %s: %s", gallery_id, meeting_data['title'])
+
         return videos_found
 
     def has_next_page(self, soup: BeautifulSoup) -> bool:
         """Check if there's a next page in the gallery pagination."""
-        # Look for pagination elements
-        next_links = soup.find_all('a', string=re.compile(r'Next|>', re.I))
-        if next_links:
-            return True
-            
-        # Look for page numbers higher than current
-        page_links = soup.find_all('a', href=re.compile(r'page=\d+'))
-        if len(page_links) > 1:  # More than just current page
+        # One walk over the anchors looks for a "Next" link and counts page-number links,
+        # running the regexes on plain strings instead of as find_all filters
+        page_links = 0
+        for link in soup.find_all('a'):
+            if link.string is not None and _NEXT_LINK_RE.search(link.string):
+                return True
+            href = link.get('href')
+            if href and _PAGE_HREF_RE.search(href):
+                page_links += 1
+        if page_links > 1:  # More than just current page
             return True
             
         # Look for specific pagination patterns
-        pagination_div = soup.find('div', class_=re.compile(r'pag', re.I))
+        pagination_div = soup.find('div', class_=_PAGINATION_CLASS_RE)
         if pagination_div:
             # If pagination div exists and has multiple links, likely has more pages
             links_in_pagination = pagination_div.find_all('a')
@@ -504,54 +1055,56 @@ class FortCollinsVideoScraper:
             
         return False
 
+    def _cablecast_search_urls(self, search_term: str) -> List[str]:
+        """Build the Cablecast search URLs queried for a term."""
+        query = search_term.replace(' ', '+')
+        return [
+            f"{_CABLECAST_BASE}/CablecastPublicSite/search?q={query}&site=1",
+            f"{_CABLECAST_BASE}/internetchannel/search?q={query}&site=1"
+        ]
+
     def search_cablecast_videos(self, search_term: str) -> None:
         """Execute multiple search queries on the Cablecast platform for a term."""
-        search_urls = [
-            f"https://reflect-vod-fcgov.cablecast.tv/CablecastPublicSite/search?q={search_term.replace(' ', '+')}&site=1",
-            f"https://reflect-vod-fcgov.cablecast.tv/internetchannel/search?q={search_term.replace(' ', '+')}&site=1"
-        ]
-        for search_url in search_urls:
+        for search_url in self._cablecast_search_urls(search_term):
             try:
                 response = self.fetch_page(search_url)
                 if response:
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    self.extract_cablecast_videos_from_page(soup)
+                    self.extract_cablecast_videos_from_page(response.content)
             except Exception as e:
-                logger.warning(f"Error searching Cablecast: {e}")
+                logger.warning("Error searching Cablecast: %s", e)
+
+    def extract_cablecast_videos_from_page(self, content: bytes) -> None:
+        """Extract video listings from the bytes of a Cablecast search results page.
 
-    def extract_cablecast_videos_from_page(self, soup: BeautifulSoup) -> None:
-        """Extract video listings from a Cablecast search results page."""
+        Only anchors and their parents' text are read, so the page is walked
+        with raw lxml instead of being built into a BeautifulSoup tree.
+        """
         try:
-            video_links = soup.find_all('a', href=re.compile(r'/show/\d+'))
-            for link in video_links:
-                href = link.get('href', '')
-                if not href:
+            # Collect matching shows from the listing first, then fetch their pages together
+            shows: Dict[int, str] = {}
+            for href, parent_text in _listing_links(content):
+                video_id_match = _SHOW_RE.search(href)
+                if not video_id_match or int(video_id_match.group(1)) in self._seen_video_ids:
                     continue
-                full_url = urljoin('https://reflect-vod-fcgov.cablecast.tv', href)
-                # Determine title text
-                title_text = link.get_text(strip=True)
-                parent = link.parent
-                if parent:
-                    parent_text = parent.get_text(strip=True)
-                    if len(parent_text) > len(title_text):
-                        title_text = parent_text
-                if self.is_fort_collins_meeting(title_text):
-                    video_id_match = re.search(r'/show/(\d+)', href)
-                    if video_id_match:
-                        video_id = int(video_id_match.group(1))
-                        video_response = self.fetch_page(full_url)
-                        if video_response:
-                            video_soup = BeautifulSoup(video_response.content, 'html.parser')
-                            meeting_data = self.extract_cablecast_video_data(video_soup, full_url, video_id)
-                            if meeting_data:
-                                unique_key = f"{meeting_data['date']}_{meeting_data['title']}"
-                                if unique_key not in self.processed_urls:
-                                    self.meetings_data.append(meeting_data)
-                                    self.processed_urls.add(unique_key)
-                                    logger.info(f"Found via search: {meeting_data['title']}")
-                        time.sleep(0.5)
+                # The parent's text always contains the link text, so it is the title candidate
+                title_text = parent_text
+                if self.is_fort_collins_meeting(title_text) and not self._known_from_listing(title_text):
+                    shows.setdefault(int(video_id_match.group(1)), _absolute_url(_CABLECAST_BASE, href))
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                results = executor.map(self._fetch_cablecast_show, shows.keys(), shows.values())
+                for meeting_data in results:
+                    if meeting_data and self._add_meeting(meeting_data):
+                        logger.info("Found via search: %s", meeting_data['title'])
         except Exception as e:
-            logger.error(f"Error extracting videos from search page: {e}")
+            logger.error("Error extracting videos from search page: %s", e)
+
+    def _fetch_cablecast_show(self, video_id: int, url: str) -> Optional[Dict[str, str]]:
+        """Fetch a Cablecast show page and extract its meeting data."""
+        response = self.fetch_page(url)
+        if not response:
+            return None
+        soup = _parse(response.content, _SHOW_PAGE_ONLY)
+        return self.extract_cablecast_video_data(soup, url, video_id, response.content)
 
     def scrape_cablecast_archive_systematic(self):
         """Systematically check ranges of Cablecast video IDs for Fort Collins content."""
@@ -565,46 +1118,120 @@ class FortCollinsVideoScraper:
             (1000, 1400),
             (500, 1000),
         ]
-        for start_id, end_id in ranges_to_check:
-            logger.info(f"Checking video IDs {start_id}-{end_id}")
-            self.check_cablecast_id_range(start_id, end_id)
+        logger.info("Checking video IDs " + ", ".join(f"{start}-{end}" for start, end in ranges_to_check))
+        self.check_cablecast_id_ranges(ranges_to_check)
 
     def check_cablecast_id_range(self, start_id: int, end_id: int) -> None:
-        """Iterate through a range of show IDs and collect Fort Collins meetings."""
+        """Probe a range of show IDs concurrently and collect Fort Collins meetings."""
+        self.check_cablecast_id_ranges([(start_id, end_id)])
+
+    def check_cablecast_id_ranges(self, ranges: List[Tuple[int, int]]) -> None:
+        """Probe several ranges of show IDs through one pool.
+
+        IDs are fed to the workers from one stream spanning every range, so the
+        pool stays busy across range boundaries. Only a small window of IDs is
+        queued at a time; an interrupted sweep stops after the in-flight probes
+        instead of working through thousands of already-submitted ones.
+        """
         fort_collins_count = 0
-        for video_id in range(start_id, end_id):
-            try:
-                urls_to_try = [
-                    f"https://reflect-vod-fcgov.cablecast.tv/CablecastPublicSite/show/{video_id}?site=1",
-                    f"https://reflect-vod-fcgov.cablecast.tv/CablecastPublicSite/show/{video_id}?channel=1"
-                ]
-                for url in urls_to_try:
-                    response = self.fetch_page(url)
-                    if response and response.status_code == 200:
-                        soup = BeautifulSoup(response.content, 'html.parser')
-                        title_elem = soup.find('h1') or soup.find('title') or soup.find('h2')
-                        if title_elem:
-                            title = title_elem.get_text(strip=True)
-                            if self.is_fort_collins_meeting(title):
-                                meeting_data = self.extract_cablecast_video_data(soup, url, video_id)
-                                if meeting_data:
-                                    unique_key = f"{meeting_data['date']}_{meeting_data['title']}"
-                                    if unique_key not in self.processed_urls:
-                                        self.meetings_data.append(meeting_data)
-                                        self.processed_urls.add(unique_key)
-                                        fort_collins_count += 1
-                                        logger.info(f"Found Fort Collins video: {title}")
-                                        break
-                        break
-                if video_id % 50 == 0:
-                    logger.info(f"Checked up to ID {video_id}, found {fort_collins_count} Fort Collins videos so far")
-                    time.sleep(1)
-            except Exception as e:
-                if "404" not in str(e):
-                    logger.debug(f"Error checking video {video_id}: {e}")
+        checked = 0
+        total = sum(max(end_id - start_id, 0) for start_id, end_id in ranges)
+        video_ids = (video_id for start_id, end_id in ranges for video_id in range(start_id, end_id))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {executor.submit(self._check_cablecast_id, video_id): video_id
+                       for video_id in islice(video_ids, 2 * self.max_workers)}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    video_id = pending.pop(future)
+                    checked += 1
+                    try:
+                        meeting_data = future.result()
+                        if meeting_data and self._add_meeting(meeting_data):
+                            fort_collins_count += 1
+                            logger.info("Found Fort Collins video: %s", meeting_data['title'])
+                    except Exception as e:
+                        if "404" not in str(e):
+                            logger.debug("Error checking video %s: %s", video_id, e)
+                    if checked % 50 == 0:
+                        logger.info("Checked %d/%d IDs, found %d Fort Collins videos so far", checked, total, fort_collins_count)
+                    for next_id in islice(video_ids, 1):
+                        pending[executor.submit(self._check_cablecast_id, next_id)] = next_id
+
+    def _head_is_html(self, url: str) -> bool:
+        """Return True when a HEAD request suggests the URL serves an HTML page worth fetching."""
+        try:
+            head = self.session.head(url, timeout=10, allow_redirects=True)
+        except requests.RequestException as e:
+            logger.debug("HEAD failed for %s: %s", url, e)
+            return False
+        if head.status_code == 405:
+            # Server does not support HEAD; let the GET decide
+            return True
+        return head.status_code == 200 and 'text/html' in head.headers.get('Content-Type', '')
+
+    def _probe_title(self, url: str) -> Optional[str]:
+        """Read the start of a page and return its title, or None if the full page must decide.
 
-    def extract_cablecast_video_data(self, soup: BeautifulSoup, page_url: str, video_id: int) -> Optional[Dict[str, str]]:
-        """Extract meeting data, MP4 download link and transcript URL from a Cablecast video page."""
+        Only the first ``_TITLE_PROBE_BYTES`` are asked for with a Range request,
+        and the short reply is read to its end so the keep-alive connection goes
+        back to the pool. The prefix decides only when it holds a closed ``<h1>``
+        or the whole body, so it gives the same title as the full-page lookup.
+        """
+        headers = {'Range': f'bytes=0-{_TITLE_PROBE_BYTES - 1}', 'Accept-Encoding': 'identity'}
+        try:
+            with self.session.get(url, timeout=30, stream=True, headers=headers) as response:
+                if response.status_code == 200:
+                    # The server ignores Range, so a probe cannot save anything: read this
+                    # page whole (keeping the connection) and send later IDs straight to a GET
+                    self._probe_titles = False
+                    return _fast_page_title(response.content)
+                if response.status_code != 206:
+                    return None
+                head = response.content
+                complete = response.headers.get('Content-Range', '').endswith(f'/{len(head)}')
+        except Exception as e:
+            logger.debug("Title probe failed for %s: %s", url, e)
+            return None
+        if not complete and b'</h1' not in head.lower():
+            return None
+        return _fast_page_title(head)
+
+    def _check_cablecast_id(self, video_id: int) -> Optional[Dict[str, str]]:
+        """Fetch a single show ID and return its meeting data when it is a Fort Collins meeting."""
+        if video_id in self._seen_video_ids:
+            return None  # Already extracted via a gallery or search listing
+        urls_to_try = [
+            f"{_CABLECAST_BASE}/CablecastPublicSite/show/{video_id}?site=1",
+            f"{_CABLECAST_BASE}/CablecastPublicSite/show/{video_id}?channel=1"
+        ]
+        for url in urls_to_try:
+            # A HEAD first skips downloading bodies for missing or non-HTML shows
+            if not self._head_is_html(url):
+                continue
+            # Most IDs are rejected on the title in the first few KB, before the full page is read;
+            # with the cache on the probe would download (and store) the whole page anyway
+            if self._probe_titles:
+                title = self._probe_title(url)
+                if title is not None and not self.is_fort_collins_meeting(title):
+                    return None
+            response = self.fetch_page(url)
+            if response and response.status_code == 200:
+                # Most IDs are rejected on title alone, so only build the full soup for matches
+                if not self.is_fort_collins_meeting(_fast_page_title(response.content)):
+                    return None
+                soup = _parse(response.content, _SHOW_PAGE_ONLY)
+                return self.extract_cablecast_video_data(soup, url, video_id, response.content)
+        return None
+
+    def extract_cablecast_video_data(self, soup: BeautifulSoup, page_url: str, video_id: int,
+                                     raw_body: bytes) -> Optional[Dict[str, str]]:
+        """Extract meeting data and MP4 download link from a Cablecast video page.
+
+        ``raw_body`` is the page's response bytes; the media and last-resort
+        MP4 searches scan it directly rather than walking the soup's text.
+        """
+        self._seen_video_ids.add(video_id)
         try:
             meeting_data: Dict[str, str] = {
                 'date': '',
@@ -630,41 +1257,30 @@ class FortCollinsVideoScraper:
                 meeting_data['title'] = title
                 meeting_data['meeting_type'] = self.categorize_meeting_type(title)
                 # Parse date and time from title when present
-                date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{2,4})', title)
+                date_match = _DATE_RE.search(title)
                 if date_match:
                     meeting_data['date'] = date_match.group(1)
-                time_match = re.search(r'(\d{1,2}:\d{2}\s*[AP]M)', title, re.IGNORECASE)
+                time_match = _TIME_RE.search(title)
                 if time_match:
                     meeting_data['time'] = time_match.group(1)
             # Find direct media links aggressively
             # 1) Straightforward <a href="*.mp4">
-            download_links = soup.find_all('a', href=re.compile(r'\.mp4($|\?)', re.I))
-            for link in download_links:
-                href = link.get('href')
-                if href:
-                    if href.startswith('http'):
-                        meeting_data['mp4_download'] = href
-                    else:
-                        meeting_data['mp4_download'] = urljoin(page_url, href)
+            for link in soup.find_all('a', href=True):
+                href = link['href']
+                if _MP4_HREF_RE.search(href):
+                    meeting_data['mp4_download'] = _absolute_url(page_url, href)
                     break
 
             # 2) Scan common elements and scripts
             if not meeting_data['mp4_download']:
-                media = self._extract_media_urls_from_html(soup, page_url)
+                media = self._extract_media_urls_from_html(soup, page_url, raw_body)
                 if media.get('mp4'):
                     meeting_data['mp4_download'] = self._pick_best_media_for_id(media['mp4'], video_id)
                 elif media.get('mpeg'):
                     meeting_data['mp4_download'] = self._pick_best_media_for_id(media['mpeg'], video_id)
                 elif media.get('m3u8'):
                     # Best-effort: attempt to derive an MP4 from HLS URL
-                    derived = self._pick_best_media_for_id(media['m3u8'], video_id) or media['m3u8'][0]
-                    candidate = derived.split('?', 1)[0].rsplit('.', 1)[0] + '.mp4'
-                    try:
-                        head = self.session.head(candidate, timeout=10, allow_redirects=True)
-                        if head.status_code == 200 and int(head.headers.get('content-length', '0')) > 0:
-                            meeting_data['mp4_download'] = candidate
-                    except Exception:
-                        pass
+                    meeting_data['mp4_download'] = self._mp4_from_hls(media['m3u8'], video_id) or ''
 
             # 3) Follow iframes/player embeds and rescan
             if not meeting_data['mp4_download']:
@@ -674,165 +1290,161 @@ class FortCollinsVideoScraper:
                 elif embed_media.get('mpeg'):
                     meeting_data['mp4_download'] = embed_media['mpeg'][0]
 
-            # 4) Fallback: parse entire page text for .mp4 URL
+            # 4) Fallback: search the whole page for an .mp4 URL
             if not meeting_data['mp4_download']:
-                page_text = soup.get_text(" ")
-                mp4_matches = re.findall(r'https?://[^\s"\'>]+\.mp4[^\s"\'>]*', page_text, flags=re.IGNORECASE)
-                if mp4_matches:
-                    meeting_data['mp4_download'] = mp4_matches[0]
-            # Attempt to determine transcript URL
-            if meeting_data['mp4_download']:
-                try:
-                    base_path = meeting_data['mp4_download'].rsplit('/', 1)[0]
-                    candidate_transcript = f"{base_path}/transcript.en.txt"
-                    head_resp = self.session.head(candidate_transcript, timeout=10)
-                    if head_resp.status_code == 200:
-                        meeting_data['transcript_url'] = candidate_transcript
-                except Exception:
-                    # If a HEAD request fails, we silently ignore transcript
-                    pass
+                match = _MP4_URL_BYTES_RE.search(raw_body)
+                if match:
+                    meeting_data['mp4_download'] = html.unescape(match.group(0).decode('utf-8', 'ignore'))
+            # Transcript URLs are probed in one batch later (see probe_transcripts)
             return meeting_data if meeting_data['title'] else None
         except Exception as e:
-            logger.error(f"Error extracting Cablecast data: {e}")
+            logger.error("Error extracting Cablecast data: %s", e)
             return None
 
     def categorize_meeting_type(self, title: str) -> str:
         """Assign a human‑readable meeting type based on keywords in the title."""
-        title_lower = title.lower()
-        # Historic Preservation
-        if 'historic preservation' in title_lower:
-            if 'regular' in title_lower:
-                return 'Historic Preservation Commission Regular Meeting'
-            return 'Historic Preservation Commission Meeting'
-        # Planning & Zoning
-        if 'planning & zoning' in title_lower or 'planning and zoning' in title_lower:
-            if 'regular' in title_lower:
-                return 'Planning & Zoning Commission Regular Meeting'
-            return 'Planning & Zoning Commission Meeting'
-        # Urban Renewal
-        if 'urban renewal' in title_lower:
-            if 'workshop' in title_lower:
-                return 'Urban Renewal Authority Workshop'
-            return 'Urban Renewal Authority Board Meeting'
-        # City Council variants
-        if 'regular meeting' in title_lower or 'regular' in title_lower:
-            return 'City Council Regular Meeting'
-        if 'work session' in title_lower:
-            return 'City Council Work Session'
-        if 'special meeting' in title_lower or 'special' in title_lower:
-            return 'City Council Special Meeting'
-        if 'adjourned' in title_lower:
-            return 'City Council Adjourned Meeting'
-        return 'City Council Meeting'
+        return _classify_title(title)[1]
 
     def enhance_with_additional_data(self):
         """Enhance meeting data by visiting detail pages for additional links."""
         logger.info("Enhancing data with additional information from detail pages...")
-        for meeting in self.meetings_data:
-            if meeting.get('detail_page') and not meeting.get('mp4_download'):
-                try:
-                    response = self.fetch_page(meeting['detail_page'])
-                    if response:
-                        soup = BeautifulSoup(response.content, 'html.parser')
-                        # Try anchors first
-                        video_links = soup.find_all('a', href=re.compile(r'(video|stream|mp4|watch)', re.I))
-                        for link in video_links:
-                            href = link.get('href', '')
-                            if 'mp4' in href.lower() and not meeting['mp4_download']:
-                                meeting['mp4_download'] = urljoin(meeting['detail_page'], href)
-                                break
-                            elif ('cablecast' in href.lower() or 'stream' in href.lower()) and not meeting['video_link']:
-                                meeting['video_link'] = urljoin(meeting['detail_page'], href)
-
-                        # If not found, scan DOM and scripts for media URLs
-                        if not meeting['mp4_download']:
-                            media = self._extract_media_urls_from_html(soup, meeting['detail_page'])
-                            if media.get('mp4'):
-                                meeting['mp4_download'] = self._pick_best_media_for_id(media['mp4'], meeting.get('video_id'))
-                            elif media.get('mpeg'):
-                                meeting['mp4_download'] = self._pick_best_media_for_id(media['mpeg'], meeting.get('video_id'))
-                            elif media.get('m3u8'):
-                                derived = self._pick_best_media_for_id(media['m3u8'], meeting.get('video_id')) or media['m3u8'][0]
-                                candidate = derived.split('?', 1)[0].rsplit('.', 1)[0] + '.mp4'
-                                try:
-                                    head = self.session.head(candidate, timeout=10, allow_redirects=True)
-                                    if head.status_code == 200 and int(head.headers.get('content-length', '0')) > 0:
-                                        meeting['mp4_download'] = candidate
-                                except Exception:
-                                    pass
-
-                        # If still not found, follow embeds from this page
-                        if not meeting['mp4_download']:
-                            # Try to deduce video_id from stored data or URL
-                            video_id = None
-                            try:
-                                if meeting.get('video_id'):
-                                    video_id = int(meeting['video_id'])
-                                else:
-                                    m = re.search(r'/show/(\d+)', meeting.get('video_link') or '')
-                                    if m:
-                                        video_id = int(m.group(1))
-                            except Exception:
-                                video_id = None
-                            embed_media = self._follow_embeds_and_players(meeting['detail_page'], soup, video_id)
-                            if embed_media.get('mp4'):
-                                meeting['mp4_download'] = embed_media['mp4'][0]
-                            elif embed_media.get('mpeg'):
-                                meeting['mp4_download'] = embed_media['mpeg'][0]
-                        # If we found an MP4 now, attempt transcript again
-                        if meeting['mp4_download'] and not meeting['transcript_url']:
-                            try:
-                                base_path = meeting['mp4_download'].rsplit('/', 1)[0]
-                                candidate_transcript = f"{base_path}/transcript.en.txt"
-                                head_resp = self.session.head(candidate_transcript, timeout=10)
-                                if head_resp.status_code == 200:
-                                    meeting['transcript_url'] = candidate_transcript
-                            except Exception:
-                                pass
-                        time.sleep(1)
-                except Exception as e:
-                    logger.warning(f"Error enhancing meeting data: {e}")
-
-    def save_to_csv(self, filename: str = 'fort_collins_all_meetings.csv') -> None:
-        """Save collected meeting data to a CSV file."""
+        targets = [m for m in self.meetings_data if m.get('detail_page') and not m.get('mp4_download')]
+        # Each worker only mutates its own meeting dict, so no locking is needed
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(executor.map(self._enhance_one, targets))
+
+    def _enhance_one(self, meeting: Dict[str, str]) -> None:
+        """Visit one meeting's detail page and fill in any media links it exposes."""
+        try:
+            response = self.fetch_page(meeting['detail_page'])
+            if response:
+                soup = _parse(response.content, _MEDIA_ONLY)
+                # Try anchors first
+                for link in soup.find_all('a', href=True):
+                    href = link['href']
+                    if not _VIDEO_HREF_RE.search(href):
+                        continue
+                    if 'mp4' in href.lower() and not meeting['mp4_download']:
+                        meeting['mp4_download'] = _absolute_url(meeting['detail_page'], href)
+                        break
+                    elif ('cablecast' in href.lower() or 'stream' in href.lower()) and not meeting['video_link']:
+                        meeting['video_link'] = _absolute_url(meeting['detail_page'], href)
+
+                # If not found, scan DOM and scripts for media URLs
+                if not meeting['mp4_download']:
+                    media = self._extract_media_urls_from_html(soup, meeting['detail_page'], response.content)
+                    if media.get('mp4'):
+                        meeting['mp4_download'] = self._pick_best_media_for_id(media['mp4'], meeting.get('video_id'))
+                    elif media.get('mpeg'):
+                        meeting['mp4_download'] = self._pick_best_media_for_id(media['mpeg'], meeting.get('video_id'))
+                    elif media.get('m3u8'):
+                        meeting['mp4_download'] = self._mp4_from_hls(media['m3u8'], meeting.get('video_id')) or ''
+
+                # If still not found, follow embeds from this page
+                if not meeting['mp4_download']:
+                    # Try to deduce video_id from stored data or URL
+                    video_id = None
+                    try:
+                        if meeting.get('video_id'):
+                            video_id = int(meeting['video_id'])
+                        else:
+                            m = _SHOW_RE.search(meeting.get('video_link') or '')
+                            if m:
+                                video_id = int(m.group(1))
+                    except Exception:
+                        video_id = None
+                    embed_media = self._follow_embeds_and_players(meeting['detail_page'], soup, video_id)
+                    if embed_media.get('mp4'):
+                        meeting['mp4_download'] = embed_media['mp4'][0]
+                    elif embed_media.get('mpeg'):
+                        meeting['mp4_download'] = embed_media['mpeg'][0]
+        except Exception as e:
+            logger.warning("Error enhancing meeting data: %s", e)
+
+    def _transcript_candidate(self, mp4_url: str) -> str:
+        """Return the companion ``transcript.en.txt`` URL for an MP4 download."""
+        return f"{mp4_url.rsplit('/', 1)[0]}/transcript.en.txt"
+
+    def _head_ok(self, url: str) -> bool:
+        """Return True when a HEAD request for the URL answers 200."""
+        try:
+            return self.session.head(url, timeout=5, allow_redirects=False).status_code == 200
+        except Exception:
+            # If a HEAD request fails, we silently ignore the candidate
+            return False
+
+    def probe_transcripts(self) -> None:
+        """Check for companion transcripts of every MP4 found so far in one concurrent batch."""
+        pending = [m for m in self.meetings_data if m.get('mp4_download') and not m.get('transcript_url')]
+        candidates = {self._transcript_candidate(m['mp4_download']) for m in pending}
+        to_probe = [u for u in candidates if u not in self._transcript_probes]
+        if to_probe:
+            logger.info("Probing %d transcript candidates...", len(to_probe))
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                self._transcript_probes.update(zip(to_probe, executor.map(self._head_ok, to_probe)))
+        for meeting in pending:
+            candidate = self._transcript_candidate(meeting['mp4_download'])
+            if self._transcript_probes.get(candidate):
+                meeting['transcript_url'] = candidate
+
+    def save_to_csv(self, filename: str = _OUTPUT_CSV) -> None:
+        """Save collected meeting data to a CSV file, sorted and deduplicated.
+
+        Once written, the file holds everything in the run's checkpoint, so the
+        checkpoint is closed and removed.
+        """
         if not self.meetings_data:
             logger.warning("No meeting data to save")
             return
-        df = pd.DataFrame(self.meetings_data)
-        # Sort by date descending when available
-        df['date_parsed'] = pd.to_datetime(df['date'], errors='coerce')
-        df = df.sort_values('date_parsed', ascending=False, na_position='last')
-        df = df.drop('date_parsed', axis=1)
-        # Deduplicate by title and date
-        df = df.drop_duplicates(subset=['title', 'date'], keep='first')
-        df.to_csv(filename, index=False)
-        logger.info(f"Saved {len(df)} meetings to {filename}")
-        self.print_summary(df, filename)
-
-    def print_summary(self, df: pd.DataFrame, filename: str) -> None:
+        # Deduplicate by title and date first so fewer rows are parsed and sorted;
+        # duplicates share a date, so keeping the first seen matches sort-then-dedup
+        seen = set()
+        rows = []
+        for meeting in self.meetings_data:
+            key = (meeting.get('title'), meeting.get('date'))
+            if key not in seen:
+                seen.add(key)
+                rows.append(meeting)
+        # Sort by date descending, undated meetings last (stable, so ties keep discovery order)
+        def sort_key(meeting: Dict[str, str]):
+            parsed = _parse_meeting_date(meeting.get('date'))
+            return (parsed is not None, parsed or datetime.min)
+        rows.sort(key=sort_key, reverse=True)
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=_CSV_FIELDS, restval='', extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(rows)
+        logger.info("Saved %d meetings to %s", len(rows), filename)
+        self._close_checkpoint(remove=True)
+        self.print_summary(rows, filename)
+
+    def print_summary(self, rows: List[Dict[str, str]], filename: str) -> None:
         """Print a summary of scraped data to the console."""
         print("\n=== COMPREHENSIVE SCRAPING SUMMARY ===")
-        print(f"Total meetings found: {len(df)}")
+        print(f"Total meetings found: {len(rows)}")
         print("\nMeeting types found:")
-        type_counts = df['meeting_type'].value_counts()
-        for mtype, count in type_counts.items():
+        type_counts = Counter(m.get('meeting_type', '') for m in rows)
+        for mtype, count in type_counts.most_common():
             print(f"  {mtype}: {count}")
         print("\nSources:")
-        source_counts = df['source'].value_counts()
-        for source, count in source_counts.items():
+        source_counts = Counter(m.get('source', '') for m in rows)
+        for source, count in source_counts.most_common():
             print(f"  {source}: {count}")
         print("\nVideo availability:")
-        print(f"  Meetings with MP4 downloads: {df['mp4_download'].notna().sum()}")
-        print(f"  Meetings with video links: {df['video_link'].notna().sum()}")
-        print(f"  Meetings with transcripts: {df['transcript_url'].notna().sum()}")
+        print(f"  Meetings with MP4 downloads: {sum(1 for m in rows if m.get('mp4_download'))}")
+        print(f"  Meetings with video links: {sum(1 for m in rows if m.get('video_link'))}")
+        print(f"  Meetings with transcripts: {sum(1 for m in rows if m.get('transcript_url'))}")
         print(f"\nCSV saved as: {filename}\n")
 
     def run_comprehensive_scraper(self, quick: bool = False) -> None:
         """Run the end‑to‑end scraping process across all sources.
 
         If quick=True, skips the slow systematic ID range scan and saves after earlier phases.
+        Meetings are appended to a checkpoint CSV as they are found; the sorted
+        CSV is written once, at the end.
         """
         logger.info("Starting comprehensive Fort Collins meeting scraper...")
+        self._open_checkpoint()
         try:
             # Phase 1: Municode
             logger.info("=== Phase\u00a01: Municode Meetings Portal ===")
@@ -846,25 +1458,40 @@ class FortCollinsVideoScraper:
                 logger.error("No meeting data found from any source after Phase 2")
                 return
 
-            # Enhance and save a partial checkpoint after early phases
+            # Enhance after early phases
             logger.info("=== Phase\u00a03: Enhanced Data Collection (early) ===")
             self.enhance_with_additional_data()
-            logger.info("=== Saving partial results (post Phase 2/3) ===")
-            self.save_to_csv()
+            self.probe_transcripts()
 
             # Optional Phase 4: Systematic scan (slow)
             if not quick:
                 logger.info("=== Phase\u00a04: Systematic Cablecast Archive Check ===")
                 self.scrape_cablecast_archive_systematic()
-                if self.meetings_data:
-                    logger.info("=== Phase\u00a05: Enhanced Data Collection (final) ===")
-                    self.enhance_with_additional_data()
-                    logger.info("=== Phase\u00a06: Saving Results ===")
-                    self.save_to_csv()
+                logger.info("=== Phase\u00a05: Enhanced Data Collection (final) ===")
+                self.enhance_with_additional_data()
+                self.probe_transcripts()
+            logger.info("=== Phase\u00a06: Saving Results ===")
+            self.save_to_csv()
             logger.info("Scraping completed successfully!")
         except Exception as e:
-            logger.error(f"Scraping failed: {e}")
+            logger.error("Scraping failed: %s", e)
             raise
+        finally:
+            # Keep the checkpoint of an interrupted or failed run unless it has no rows
+            self._close_checkpoint(remove=not self.meetings_data)
+            self._shutdown_probe_executor()
+
+
+def _positive_rate(value: str) -> float:
+    """argparse type for --rate: a request rate must be a positive, finite number."""
+    import argparse
+    try:
+        rate = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid rate: {value!r}")
+    if not (rate > 0 and math.isfinite(rate)):
+        raise argparse.ArgumentTypeError(f"rate must be a finite number greater than 0, got {value}")
+    return rate
 
 
 def main() -> None:
@@ -872,8 +1499,13 @@ def main() -> None:
     import argparse
     parser = argparse.ArgumentParser(description='Fort Collins meeting scraper')
     parser.add_argument('--quick', action='store_true', help='Skip slow ID-range scan; save after galleries/search')
+    parser.add_argument('--max-workers', type=int, default=16, help='Number of concurrent page fetches (default: 16)')
+    parser.add_argument('--rate', type=_positive_rate, default=_DEFAULT_REQUESTS_PER_SECOND,
+                        help='Maximum network requests per second (default: 20)')
+    parser.add_argument('--no-cache', action='store_true', help='Bypass the on-disk HTTP cache for this run')
     args = parser.parse_args()
-    scraper = FortCollinsVideoScraper()
+    scraper = FortCollinsVideoScraper(max_workers=args.max_workers, requests_per_second=args.rate,
+                                      use_cache=not args.no_cache)
     try:
         scraper.run_comprehensive_scraper(quick=args.quick)
     except KeyboardInterrupt:
@@ -884,9 +1516,9 @@ def main() -> None:
                 logger.info("Saving partial results before exit due to interruption...")
                 scraper.save_to_csv()
         except Exception as e:
-            logger.warning(f"Failed to save partial results: {e}")
+            logger.warning("Failed to save partial results: %s", e)
     except Exception as e:
-        logger.error(f"Scraping failed: {e}")
+        logger.error("Scraping failed: %s", e)
 
 
 if __name__ == "__main__":
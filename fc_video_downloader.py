@@ -28,27 +28,117 @@ only difference is that transcripts are downloaded alongside other
 documents by default.
 """
 
-import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 import time
 import logging
 from urllib.parse import urlparse, unquote
 from pathlib import Path
 import re
+import html
+import shutil
 from tqdm import tqdm
 import argparse
 import json
 import hashlib
 from datetime import datetime
+from functools import lru_cache
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 from bs4 import BeautifulSoup
 
+try:
+    import orjson
+except ImportError:  # Optional: the stdlib json module reads and writes the same archive
+    orjson = None
+
 # Setup logging
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# lxml's C tree builder (already a requirement) parses pages several times faster than html.parser
+_PARSER = 'lxml'
+
+# Read size for file transfers; large reads keep multi-hundred-MB videos network-bound
+_DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+# Characters not allowed in filenames, each mapped to '_' in one translate pass
+_UNSAFE_FILENAME_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+
+# Patterns used per meeting row and per resolved page, compiled once
+_SHOW_RE = re.compile(r'/show/(\d+)')
+_MP4_URL_RE = re.compile(r'https?://[^"\'\s>]+\.mp4[^"\'\s>]*', re.I)
+_MPEG_URL_RE = re.compile(r'https?://[^"\'\s>]+\.mpeg[^"\'\s>]*', re.I)
+_M3U8_URL_RE = re.compile(r'https?://[^"\'\s>]+\.m3u8[^"\'\s>]*', re.I)
+_MP4_URL_BYTES_RE = re.compile(rb'https?://[^"\'\s>]+\.mp4[^"\'\s>]*', re.I)
+
+
+@lru_cache(maxsize=4096)
+def _file_hash(url, meeting_title, date, file_type) -> str:
+    """Archive key for a file; memoized since each file is hashed on lookup and again when archived."""
+    identifier = f"{url}_{meeting_title}_{date}_{file_type}"
+    return hashlib.md5(identifier.encode()).hexdigest()
+
+
+def _json_loads(data: bytes):
+    """Decode JSON with orjson when it is installed."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Encode compact JSON with orjson when it is installed; NumPy scalars from CSV rows are accepted."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _parse_dates(dates):
+    """Parse a column of CSV dates to Timestamps (NaT when unparseable).
+
+    The scraper writes m/d/Y dates (m/d/y on some Cablecast titles); pinning the
+    formats skips pandas' per-element format inference.
+    """
+    import pandas as pd
+    dates = dates.astype(str)
+    parsed = pd.to_datetime(dates, format='%m/%d/%Y', errors='coerce')
+    return parsed.fillna(pd.to_datetime(dates, format='%m/%d/%y', errors='coerce'))
+
+
+class _ProgressWriter:
+    """Write-only file wrapper that counts bytes and advances a tqdm bar."""
+
+    def __init__(self, f, pbar) -> None:
+        self._f = f
+        self._pbar = pbar
+        self.bytes_written = 0
+
+    def write(self, data) -> int:
+        self._f.write(data)
+        self.bytes_written += len(data)
+        self._pbar.update(len(data))
+        return len(data)
+
+
+def _content_range_total(headers):
+    """Return the full size from a ``Content-Range`` header (``bytes */N`` or ``bytes a-b/N``), or None."""
+    _, _, total = headers.get('Content-Range', '').rpartition('/')
+    return int(total) if total.strip().isdigit() else None
+
+
+def _range_validator(headers):
+    """Return the value to send as ``If-Range`` on a resume: a strong ETag, else Last-Modified."""
+    etag = headers.get('ETag')
+    if etag and not etag.startswith('W/'):  # Weak ETags are not allowed in If-Range
+        return etag
+    return headers.get('Last-Modified')
+
+
+def _is_missing(value) -> bool:
+    """Return True for an empty CSV cell (None or NaN), without importing pandas."""
+    return value is None or value != value
+
 
 class EnhancedFortCollinsVideoDownloader:
     """Download videos, audio, documents and transcripts based on meeting CSV."""
@@ -62,42 +152,96 @@ class EnhancedFortCollinsVideoDownloader:
         (self.download_dir / 'documents').mkdir(exist_ok=True)
         # Archive tracking
         self.archive_file = self.download_dir / 'download_archive.json'
+        # Each download is appended here as it completes, so an interrupted run keeps
+        # its progress; save_archive folds the log into the snapshot and removes it
+        self.archive_log_file = self.download_dir / 'download_archive.jsonl'
+        self._archive_log = None
         self.failed_downloads_file = self.download_dir / 'failed_downloads.json'
         self.downloaded_files: list[dict] = []
         self.failed_downloads: list[dict] = []
         self.archive_data = self.load_archive()
+        # file_hash -> record; the source of truth for lookups, copied back into
+        # archive_data['downloads'] (in insertion order) by save_archive
+        self._archive_index: dict[str, dict] = {d.get('file_hash'): d for d in self.archive_data['downloads']}
+        # URLs with an archive record; a URL missing here needs no hash or index lookup
+        self._archived_urls: set = {d.get('url') for d in self.archive_data['downloads']}
+        # Files present in the download subdirectories, listed once instead of
+        # stat-ing every archived path
+        self._scanned_dirs = {str(self.download_dir / sub) for sub in ('videos', 'audio', 'documents')}
+        self._on_disk: set[str] = set()
+        for directory in self._scanned_dirs:
+            with os.scandir(directory) as entries:
+                self._on_disk.update(entry.path for entry in entries if entry.is_file())
         self.archive_lock = threading.Lock()
         # HTTP session
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        # Size the keep-alive pool to the worker count so parallel downloads reuse
+        # connections, and retry transient server errors with backoff
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_maxsize=max(max_workers, 10), max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.max_workers = max_workers
 
     def load_archive(self) -> dict:
-        """Load existing archive or initialize a new one."""
+        """Load existing archive or initialize a new one, replaying any unsaved download log."""
+        archive = {'downloads': [], 'last_updated': None}
         if self.archive_file.exists():
             try:
-                with open(self.archive_file, 'r') as f:
-                    archive = json.load(f)
-                logger.info(f"Loaded archive with {len(archive.get('downloads', []))} tracked files")
-                return archive
+                with open(self.archive_file, 'rb') as f:
+                    archive = _json_loads(f.read())
+                logger.info("Loaded archive with %d tracked files", len(archive.get('downloads', [])))
             except Exception as e:
-                logger.warning(f"Error loading archive: {e}")
-                return {'downloads': [], 'last_updated': None}
-        logger.info("No existing archive found, starting fresh")
-        return {'downloads': [], 'last_updated': None}
+                logger.warning("Error loading archive: %s", e)
+                archive = {'downloads': [], 'last_updated': None}
+        else:
+            logger.info("No existing archive found, starting fresh")
+        logged = self._read_archive_log()
+        if logged:
+            records = {d.get('file_hash'): d for d in archive.setdefault('downloads', [])}
+            for record in logged:
+                records.pop(record.get('file_hash'), None)
+                records[record.get('file_hash')] = record
+            archive['downloads'] = list(records.values())
+            logger.info("Recovered %d downloads from %s", len(logged), self.archive_log_file.name)
+        return archive
+
+    def _read_archive_log(self) -> list:
+        """Return the records appended to the download log by a run that did not save its archive."""
+        if not self.archive_log_file.exists():
+            return []
+        records = []
+        with open(self.archive_log_file, 'rb') as f:
+            for line in f:
+                try:
+                    records.append(_json_loads(line))
+                except ValueError:  # Blank, or cut short by a crash
+                    continue
+        return records
 
     def save_archive(self) -> None:
         """Persist archive to disk."""
         with self.archive_lock:
+            self.archive_data['downloads'] = list(self._archive_index.values())
             self.archive_data['last_updated'] = datetime.now().isoformat()
             try:
-                with open(self.archive_file, 'w') as f:
-                    json.dump(self.archive_data, f, indent=2)
-                logger.info(f"Archive saved with {len(self.archive_data['downloads'])} tracked files")
+                with open(self.archive_file, 'wb') as f:
+                    f.write(_json_dumps(self.archive_data))
+                logger.info("Archive saved with %d tracked files", len(self.archive_data['downloads']))
             except Exception as e:
-                logger.error(f"Error saving archive: {e}")
+                logger.error("Error saving archive: %s", e)
+                return
+            # The snapshot now holds everything in the log
+            if self._archive_log is not None:
+                self._archive_log.close()
+                self._archive_log = None
+            try:
+                self.archive_log_file.unlink()
+            except FileNotFoundError:
+                pass
 
     def load_failed_downloads(self) -> list:
         """Load the list of failed downloads."""
@@ -106,7 +250,7 @@ class EnhancedFortCollinsVideoDownloader:
                 with open(self.failed_downloads_file, 'r') as f:
                     return json.load(f)
             except Exception as e:
-                logger.warning(f"Error loading failed downloads file: {e}")
+                logger.warning("Error loading failed downloads file: %s", e)
         return []
 
     def save_failed_downloads(self) -> None:
@@ -114,28 +258,31 @@ class EnhancedFortCollinsVideoDownloader:
         try:
             with open(self.failed_downloads_file, 'w') as f:
                 json.dump(self.failed_downloads, f, indent=2)
-            logger.info(f"Saved {len(self.failed_downloads)} failed downloads to {self.failed_downloads_file}")
+            logger.info("Saved %d failed downloads to %s", len(self.failed_downloads), self.failed_downloads_file)
         except Exception as e:
-            logger.error(f"Error saving failed downloads: {e}")
+            logger.error("Error saving failed downloads: %s", e)
 
     def generate_file_hash(self, url, meeting_title, date, file_type):
         """Generate a unique hash for a file based on its metadata."""
-        identifier = f"{url}_{meeting_title}_{date}_{file_type}"
-        return hashlib.md5(identifier.encode()).hexdigest()
+        return _file_hash(url, meeting_title, date, file_type)
 
     def is_file_downloaded(self, url, meeting_title, date, file_type):
         """Check if a file has already been downloaded."""
+        if url not in self._archived_urls:
+            return False, None
         file_hash = self.generate_file_hash(url, meeting_title, date, file_type)
         with self.archive_lock:
-            for download_record in self.archive_data['downloads']:
-                if download_record.get('file_hash') == file_hash:
-                    file_path = Path(download_record.get('file_path', ''))
-                    if file_path.exists():
-                        logger.debug(f"File already downloaded: {file_path.name}")
-                        return True, file_path
-                    else:
-                        logger.warning(f"Archived file not found on disk: {file_path}")
-                        self.archive_data['downloads'] = [d for d in self.archive_data['downloads'] if d.get('file_hash') != file_hash]
+            download_record = self._archive_index.get(file_hash)
+            if download_record is not None:
+                path_str = download_record.get('file_path', '')
+                file_path = Path(path_str)
+                # Paths outside the scanned directories (an earlier --output) are still stat-ed
+                if path_str in self._on_disk or (os.path.dirname(path_str) not in self._scanned_dirs
+                                                 and file_path.exists()):
+                    logger.debug("File already downloaded: %s", file_path.name)
+                    return True, file_path
+                logger.warning("Archived file not found on disk: %s", file_path)
+                del self._archive_index[file_hash]
             return False, None
 
     def add_to_archive(self, url, meeting_title, date, file_type, file_path, file_size):
@@ -153,30 +300,43 @@ class EnhancedFortCollinsVideoDownloader:
             'filename': file_path.name
         }
         with self.archive_lock:
-            self.archive_data['downloads'] = [d for d in self.archive_data['downloads'] if d.get('file_hash') != file_hash]
-            self.archive_data['downloads'].append(download_record)
+            # Re-inserting moves a replaced record to the end, as the newest download
+            self._archive_index.pop(file_hash, None)
+            self._archive_index[file_hash] = download_record
+            self._archived_urls.add(url)
+            self._on_disk.add(str(file_path))
+            if self._archive_log is None:
+                self._archive_log = open(self.archive_log_file, 'ab')
+            self._archive_log.write(_json_dumps(download_record) + b'\n')
+            self._archive_log.flush()
 
     def load_csv_data(self):
         """Load meeting metadata from CSV."""
+        # pandas is imported here so --show-archive and --help start without it
+        import pandas as pd
         try:
             df = pd.read_csv(self.csv_file)
-            logger.info(f"Loaded {len(df)} meetings from {self.csv_file}")
+            df['date_parsed'] = _parse_dates(df['date'])
+            logger.info("Loaded %d meetings from %s", len(df), self.csv_file)
             return df
         except FileNotFoundError:
-            logger.error(f"CSV file {self.csv_file} not found. Please run the scraper first.")
+            logger.error("CSV file %s not found. Please run the scraper first.", self.csv_file)
             return None
         except Exception as e:
-            logger.error(f"Error reading CSV: {e}")
+            logger.error("Error reading CSV: %s", e)
             return None
 
     def sanitize_filename(self, filename):
         """Sanitize a filename for saving to disk."""
-        filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
-        filename = re.sub(r'[\s]+', '_', filename)
-        return filename.strip('._')[:200]
+        # split() with no separator breaks on runs of whitespace, so each run becomes one '_'
+        return '_'.join(filename.translate(_UNSAFE_FILENAME_TABLE).split()).strip('._')[:200]
+
+    def get_filename_from_url(self, url, meeting_title, date, file_type='video', label=''):
+        """Generate a friendly filename based on meeting info and URL.
 
-    def get_filename_from_url(self, url, meeting_title, date, file_type='video'):
-        """Generate a friendly filename based on meeting info and URL."""
+        ``label`` (e.g. ``'agenda'`` or ``'minutes'``) is appended to the title so
+        several documents of one meeting get distinct names.
+        """
         parsed_url = urlparse(url)
         original_name = os.path.basename(unquote(parsed_url.path))
         clean_title = self.sanitize_filename(meeting_title)
@@ -193,34 +353,99 @@ class EnhancedFortCollinsVideoDownloader:
                 extension = '.txt'
             else:
                 extension = '.pdf'
+        if label:
+            clean_title = f"{clean_title}_{label}"
         return f"{clean_date}_{clean_title}{extension}"
 
-    def download_file(self, url, local_path, chunk_size=8192):
-        """Download a file from a URL with a progress bar.  Returns the number of bytes saved."""
-        try:
-            response = self.session.get(url, stream=True, timeout=30)
-            response.raise_for_status()
-            total_size = int(response.headers.get('content-length', 0))
-            bytes_written = 0
-            with open(local_path, 'wb') as f:
-                if total_size > 0:
-                    with tqdm(total=total_size, unit='B', unit_scale=True, desc=local_path.name, leave=False) as pbar:
-                        for chunk in response.iter_content(chunk_size=chunk_size):
-                            if chunk:
-                                f.write(chunk)
-                                bytes_written += len(chunk)
-                                pbar.update(len(chunk))
-                else:
-                    for chunk in response.iter_content(chunk_size=chunk_size):
-                        if chunk:
-                            f.write(chunk)
-                            bytes_written += len(chunk)
-            return bytes_written
-        except Exception as e:
-            logger.error(f"Error downloading {url}: {e}")
-            if local_path.exists():
-                os.remove(local_path)
-            return 0
+    def download_file(self, url, local_path, chunk_size=_DOWNLOAD_CHUNK_SIZE, attempts=3):
+        """Download a file from a URL with a progress bar.  Returns the number of bytes saved.
+
+        Data is written to ``<name>.part`` and renamed into place once complete.
+        A transfer cut off mid-stream is retried with backoff, resuming from the
+        ``.part`` file with a Range request when the server supports it; a
+        ``.part`` left by an earlier run is resumed the same way, or simply
+        renamed if the server reports it is already complete. Resumes send
+        ``If-Range`` with the validator saved in ``<name>.part.validator``, so a
+        file changed on the server is fetched whole rather than spliced onto
+        stale bytes. Failures of the request itself are retried by the
+        session's adapter, not here.
+        """
+        part_path = local_path.with_name(local_path.name + '.part')
+        validator_path = local_path.with_name(local_path.name + '.part.validator')
+
+        def discard_part():
+            part_path.unlink(missing_ok=True)
+            validator_path.unlink(missing_ok=True)
+
+        attempt = 0
+        while True:
+            offset = part_path.stat().st_size if part_path.exists() else 0
+            validator = validator_path.read_text(encoding='utf-8') if offset and validator_path.exists() else None
+            if offset and not validator:
+                # Nothing shows the .part still matches the server's file; start over
+                discard_part()
+                offset = 0
+            # Byte offsets only line up with an unencoded body
+            headers = ({'Range': f'bytes={offset}-', 'If-Range': validator, 'Accept-Encoding': 'identity'}
+                       if offset else None)
+            try:
+                with self.session.get(url, stream=True, timeout=30, headers=headers) as response:
+                    if offset and response.status_code == 416:
+                        if _content_range_total(response.headers) == offset:
+                            # Nothing lies past the end of the .part: it already holds the whole file
+                            os.replace(part_path, local_path)
+                            validator_path.unlink(missing_ok=True)
+                            return offset
+                        # The .part cannot be extended (stale); start over at once.
+                        # Restarts send no Range, so they cannot loop.
+                        discard_part()
+                        continue
+                    response.raise_for_status()
+                    resumed = (offset > 0 and response.status_code == 206
+                               and response.headers.get('Content-Range', '').startswith(f'bytes {offset}-')
+                               and not response.headers.get('Content-Encoding'))
+                    if offset and not resumed:
+                        if response.status_code == 206:  # A range we cannot append; ask again for the whole file
+                            discard_part()
+                            continue
+                        offset = 0  # The file changed or the server ignored the Range: it sent the whole file
+                    if not resumed:
+                        # Record what a later resume must match before any bytes land in the .part
+                        new_validator = _range_validator(response.headers)
+                        if new_validator:
+                            validator_path.write_text(new_validator, encoding='utf-8')
+                        else:
+                            validator_path.unlink(missing_ok=True)
+                    expected = int(response.headers.get('content-length', 0))
+                    # Copy straight from the socket in large reads; urllib3 still undoes any
+                    # Content-Encoding, as iter_content would. The bar is hidden when the size is unknown.
+                    response.raw.decode_content = True
+                    with open(part_path, 'ab' if resumed else 'wb') as f, \
+                            tqdm(total=offset + expected, initial=offset, unit='B', unit_scale=True,
+                                 desc=local_path.name, leave=False, disable=expected <= 0) as pbar:
+                        writer = _ProgressWriter(f, pbar)
+                        shutil.copyfileobj(response.raw, writer, chunk_size)
+                    if expected and not response.headers.get('Content-Encoding') and writer.bytes_written != expected:
+                        raise IOError(f"connection closed after {writer.bytes_written} of {expected} bytes")
+                os.replace(part_path, local_path)
+                validator_path.unlink(missing_ok=True)
+                return offset + writer.bytes_written
+            except requests.RequestException as e:
+                # The server refused the file, or the adapter already used up its retries
+                # on the request; retrying here would only repeat them
+                logger.error("Error downloading %s: %s", url, e)
+                break
+            except Exception as e:
+                # The transfer broke off mid-stream, which the adapter cannot retry
+                attempt += 1
+                logger.warning("Attempt %d failed for %s: %s", attempt, url, e)
+                if attempt >= attempts:
+                    logger.error("Error downloading %s: gave up after %d attempts", url, attempts)
+                    break
+                time.sleep(2 ** attempt)
+        if part_path.exists() and part_path.stat().st_size == 0:
+            discard_part()
+        return 0
 
     def _extract_media_urls_from_html(self, soup: BeautifulSoup, base_url: str) -> dict:
         """Extract media URLs from common HTML elements and script text."""
@@ -249,16 +474,9 @@ class EnhancedFortCollinsVideoDownloader:
 
         combined_script = '\n'.join([s.get_text(' ', strip=False) for s in soup.find_all('script')])
         if combined_script:
-            for pattern, kind in [
-                (r'https?://[^"\'\s>]+\.mp4[^"\'\s>]*', 'mp4'),
-                (r'https?://[^"\'\s>]+\.mpeg[^"\'\s>]*', 'mpeg'),
-                (r'https?://[^"\'\s>]+\.m3u8[^"\'\s>]*', 'm3u8'),
-            ]:
-                try:
-                    for match in re.findall(pattern, combined_script, flags=re.IGNORECASE):
-                        add(kind, match)
-                except re.error:
-                    continue
+            for pattern, kind in [(_MP4_URL_RE, 'mp4'), (_MPEG_URL_RE, 'mpeg'), (_M3U8_URL_RE, 'm3u8')]:
+                for match in pattern.findall(combined_script):
+                    add(kind, match)
 
         return media
 
@@ -268,7 +486,7 @@ class EnhancedFortCollinsVideoDownloader:
             resp = self.session.get(page_url, timeout=20)
             if resp.status_code != 200:
                 return ''
-            soup = BeautifulSoup(resp.content, 'html.parser')
+            soup = BeautifulSoup(resp.content, _PARSER)
             # Simple anchor first
             for a in soup.find_all('a', href=True):
                 href = a['href']
@@ -291,7 +509,7 @@ class EnhancedFortCollinsVideoDownloader:
                     pass
             # Try common embed endpoints using show ID
             show_id = None
-            m = re.search(r'/show/(\d+)', page_url)
+            m = _SHOW_RE.search(page_url)
             if m:
                 show_id = m.group(1)
             if show_id:
@@ -305,7 +523,7 @@ class EnhancedFortCollinsVideoDownloader:
                         eresp = self.session.get(embed_url, timeout=15)
                         if eresp.status_code != 200:
                             continue
-                        esoup = BeautifulSoup(eresp.content, 'html.parser')
+                        esoup = BeautifulSoup(eresp.content, _PARSER)
                         emedia = self._extract_media_urls_from_html(esoup, embed_url)
                         if emedia.get('mp4'):
                             return emedia['mp4'][0]
@@ -321,33 +539,35 @@ class EnhancedFortCollinsVideoDownloader:
                                 pass
                     except Exception:
                         continue
-            # Text fallback
-            text = soup.get_text(' ')
-            m = re.search(r'https?://[^\s"\'>]+\.mp4[^\s"\'>]*', text, flags=re.IGNORECASE)
-            return m.group(0) if m else ''
+            # Raw-body fallback: scan the response bytes rather than the soup's text
+            m = _MP4_URL_BYTES_RE.search(resp.content)
+            return html.unescape(m.group(0).decode('utf-8', 'ignore')) if m else ''
         except Exception as e:
-            logger.debug(f"Failed to resolve MP4 from {page_url}: {e}")
+            logger.debug("Failed to resolve MP4 from %s: %s", page_url, e)
             return ''
 
-    def _download_worker(self, meeting, download_videos, download_audio, download_docs):
-        """Worker function to download files for a single meeting."""
+    def _plan_worker(self, meeting, download_videos, download_audio, download_docs):
+        """Worker function to plan downloads for a single meeting, returning ``(jobs, failed)``."""
         try:
-            return self.download_meeting_files(meeting, download_videos, download_audio, download_docs)
+            return self.plan_meeting_downloads(meeting, download_videos, download_audio, download_docs), []
         except Exception as e:
-            logger.error(f"Error in download worker for meeting {meeting.get('title', '')}: {e}")
+            logger.error("Error in download worker for meeting %s: %s", meeting.get('title', ''), e)
             return [], [{'type': 'unknown', 'meeting': meeting.get('title', ''), 'url': '', 'error': str(e)}]
 
-    def download_meeting_files(self, meeting, download_videos, download_audio, download_docs):
-        """Download available files for a single meeting row."""
+    def plan_meeting_downloads(self, meeting, download_videos, download_audio, download_docs):
+        """Return the files still needed for one meeting row as ``(url, local_path, meta)`` jobs.
+
+        ``meta`` is ``(file_type, title, date)``. Cablecast show pages are resolved
+        to direct MP4 links here; the transfers themselves are left to the caller.
+        """
         title = meeting.get('title', '')
         date = meeting.get('date', '')
-        downloaded = []
-        failed = []
+        candidates = []  # (url, file_type, subdirectory, filename label)
 
         # Video
         if download_videos:
             video_url = meeting.get('mp4_download') or meeting.get('video_link')
-            if video_url and pd.notna(video_url) and str(video_url).strip():
+            if video_url and not _is_missing(video_url) and str(video_url).strip():
                 # If it's a Cablecast show page, attempt to resolve a direct MP4 first
                 url_str = str(video_url)
                 if 'cablecast.tv' in url_str and '/show/' in url_str:
@@ -359,7 +579,7 @@ class EnhancedFortCollinsVideoDownloader:
                     parsed = requests.utils.urlparse(str(video_url))
                     # Extract show id if present in meeting row
                     meeting_id = None
-                    if 'video_id' in meeting and pd.notna(meeting['video_id']):
+                    if 'video_id' in meeting and not _is_missing(meeting['video_id']):
                         meeting_id = str(int(float(meeting['video_id'])))
                     if meeting_id and parsed.path:
                         if meeting_id not in parsed.path:
@@ -369,56 +589,51 @@ class EnhancedFortCollinsVideoDownloader:
                                 video_url = better
                 except Exception:
                     pass
-                already, _ = self.is_file_downloaded(video_url, title, date, 'video')
-                if not already:
-                    filename = self.get_filename_from_url(video_url, title, date, 'video')
-                    local_path = self.download_dir / 'videos' / filename
-                    logger.info(f"Downloading video: {title} ({date})")
-                    size = self.download_file(video_url, local_path)
-                    if size > 0:
-                        self.add_to_archive(video_url, title, date, 'video', local_path, size)
-                        downloaded.append({'type': 'video', 'meeting': title, 'url': video_url})
-                    else:
-                        failed.append({'type': 'video', 'meeting': title, 'url': video_url})
+                candidates.append((video_url, 'video', 'videos', ''))
 
         # Audio
         if download_audio:
             audio_url = meeting.get('audio_link')
-            if audio_url and pd.notna(audio_url) and str(audio_url).strip():
-                already, _ = self.is_file_downloaded(audio_url, title, date, 'audio')
-                if not already:
-                    filename = self.get_filename_from_url(audio_url, title, date, 'audio')
-                    local_path = self.download_dir / 'audio' / filename
-                    logger.info(f"Downloading audio: {title} ({date})")
-                    size = self.download_file(audio_url, local_path)
-                    if size > 0:
-                        self.add_to_archive(audio_url, title, date, 'audio', local_path, size)
-                        downloaded.append({'type': 'audio', 'meeting': title, 'url': audio_url})
-                    else:
-                        failed.append({'type': 'audio', 'meeting': title, 'url': audio_url})
+            if audio_url and not _is_missing(audio_url) and str(audio_url).strip():
+                candidates.append((audio_url, 'audio', 'audio', ''))
 
         # Documents
         if download_docs:
-            doc_links = []
             for field_name in ['agenda_pdf', 'agenda_html', 'minutes_pdf', 'minutes_html', 'transcript_url']:
                 link = meeting.get(field_name)
                 if isinstance(link, str) and link:
                     file_type = 'transcript' if field_name == 'transcript_url' else 'document'
-                    doc_links.append((link, file_type))
-
-            for url, file_type in doc_links:
-                already, _ = self.is_file_downloaded(url, title, date, file_type)
-                if not already:
-                    filename = self.get_filename_from_url(url, title, date, file_type)
-                    local_path = self.download_dir / 'documents' / filename
-                    logger.info(f"Downloading {file_type}: {title} ({date})")
-                    size = self.download_file(url, local_path)
-                    if size > 0:
-                        self.add_to_archive(url, title, date, file_type, local_path, size)
-                        downloaded.append({'type': file_type, 'meeting': title, 'url': url})
-                    else:
-                        failed.append({'type': file_type, 'meeting': title, 'url': url})
+                    # Documents share a directory, so each field gets its own name
+                    # (agenda, agenda_html, minutes, minutes_html, transcript)
+                    label = field_name.replace('_pdf', '').replace('_url', '')
+                    candidates.append((link, file_type, 'documents', label))
+
+        jobs = []
+        for url, file_type, subdir, label in candidates:
+            already, _ = self.is_file_downloaded(url, title, date, file_type)
+            if not already:
+                filename = self.get_filename_from_url(url, title, date, file_type, label)
+                jobs.append((url, self.download_dir / subdir / filename, (file_type, title, date)))
+        return jobs
+
+    def _download_job(self, url, local_path, meta):
+        """Download one planned file and archive it; returns ``(succeeded, record)``."""
+        file_type, title, date = meta
+        logger.info("Downloading %s: %s (%s)", file_type, title, date)
+        size = self.download_file(url, local_path)
+        record = {'type': file_type, 'meeting': title, 'url': url}
+        if size > 0:
+            self.add_to_archive(url, title, date, file_type, local_path, size)
+            return True, record
+        return False, record
 
+    def download_meeting_files(self, meeting, download_videos, download_audio, download_docs):
+        """Download available files for a single meeting row, one after another."""
+        downloaded = []
+        failed = []
+        for job in self.plan_meeting_downloads(meeting, download_videos, download_audio, download_docs):
+            succeeded, record = self._download_job(*job)
+            (downloaded if succeeded else failed).append(record)
         return downloaded, failed
 
     def filter_meetings(self, df, meeting_types=None, date_range=None, limit=None):
@@ -426,19 +641,19 @@ class EnhancedFortCollinsVideoDownloader:
         filtered_df = df.copy()
         if meeting_types:
             filtered_df = filtered_df[filtered_df['meeting_type'].isin(meeting_types)]
-            logger.info(f"Filtered to {len(filtered_df)} meetings by type: {meeting_types}")
+            logger.info("Filtered to %d meetings by type: %s", len(filtered_df), meeting_types)
         if date_range:
             try:
                 start_date, end_date = date_range
-                filtered_df['date_parsed'] = pd.to_datetime(filtered_df['date'], errors='coerce')
-                filtered_df = filtered_df[(filtered_df['date_parsed'] >= start_date) & (filtered_df['date_parsed'] <= end_date)]
-                filtered_df = filtered_df.drop('date_parsed', axis=1)
-                logger.info(f"Filtered to {len(filtered_df)} meetings by date range: {start_date} to {end_date}")
+                # load_csv_data parses dates once; frames built elsewhere are parsed here
+                dates = filtered_df['date_parsed'] if 'date_parsed' in filtered_df else _parse_dates(filtered_df['date'])
+                filtered_df = filtered_df[dates.between(start_date, end_date)]
+                logger.info("Filtered to %d meetings by date range: %s to %s", len(filtered_df), start_date, end_date)
             except Exception as e:
-                logger.warning(f"Date filtering failed: {e}")
+                logger.warning("Date filtering failed: %s", e)
         if limit:
             filtered_df = filtered_df.head(limit)
-            logger.info(f"Limited to {len(filtered_df)} meetings")
+            logger.info("Limited to %d meetings", len(filtered_df))
         return filtered_df
 
     def download_all(self, meeting_types=None, date_range=None, limit=None,
@@ -449,7 +664,7 @@ class EnhancedFortCollinsVideoDownloader:
             if not meetings_to_download:
                 logger.info("No failed downloads to retry.")
                 return
-            logger.info(f"Retrying {len(meetings_to_download)} failed downloads.")
+            logger.info("Retrying %d failed downloads.", len(meetings_to_download))
             # Clear the failed downloads log before retrying
             self.failed_downloads = []
             self.save_failed_downloads()
@@ -463,20 +678,42 @@ class EnhancedFortCollinsVideoDownloader:
                 return
             meetings_to_download = filtered_df.to_dict('records')
 
-        logger.info(f"Starting download of files for {len(meetings_to_download)} meetings...")
-        logger.info(f"Archive contains {len(self.archive_data['downloads'])} previously downloaded files")
+        logger.info("Starting download of files for %d meetings...", len(meetings_to_download))
+        logger.info("Archive contains %d previously downloaded files", len(self.archive_data['downloads']))
 
+        # Meetings are planned in the pool (resolving Cablecast pages to MP4s) and each
+        # planned file is queued as its own job, so a meeting's agenda and minutes no
+        # longer wait behind its video and one large file does not hold up a worker's
+        # whole meeting
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {executor.submit(self._download_worker, meeting, download_videos, download_audio, download_docs): meeting for meeting in meetings_to_download}
-            for future in tqdm(as_completed(futures), total=len(futures), desc="Downloading Meetings"):
-                meeting = futures[future]
+            plans = [executor.submit(self._plan_worker, meeting, download_videos, download_audio, download_docs)
+                     for meeting in meetings_to_download]
+            jobs = {}
+            queued_paths = {}  # Local path -> URL queued for it
+            for future in as_completed(plans):
+                planned, failed = future.result()
+                self.failed_downloads.extend(failed)
+                for url, local_path, meta in planned:
+                    queued_url = queued_paths.get(local_path)
+                    if queued_url is None:
+                        queued_paths[local_path] = url
+                        jobs[executor.submit(self._download_job, url, local_path, meta)] = (url, meta)
+                    elif queued_url != url:
+                        # A different file would overwrite the queued one; report it instead
+                        file_type, title, _ = meta
+                        logger.warning("Not downloading %s for %s: %s is already queued from %s",
+                                       url, title, local_path.name, queued_url)
+                        self.failed_downloads.append({'type': file_type, 'meeting': title, 'url': url,
+                                                      'error': f"file name collides with {queued_url}"})
+                    # Otherwise two rows name the same file, which is already queued
+            for future in tqdm(as_completed(jobs), total=len(jobs), desc="Downloading Files"):
                 try:
-                    downloaded, failed = future.result()
-                    self.downloaded_files.extend(downloaded)
-                    self.failed_downloads.extend(failed)
+                    succeeded, record = future.result()
+                    (self.downloaded_files if succeeded else self.failed_downloads).append(record)
                 except Exception as e:
-                    logger.error(f"Error processing meeting {meeting.get('title', '')}: {e}")
-                    self.failed_downloads.append({'type': 'unknown', 'meeting': meeting.get('title', ''), 'url': '', 'error': str(e)})
+                    url, (file_type, title, _) = jobs[future]
+                    logger.error("Error downloading %s for %s: %s", file_type, title, e)
+                    self.failed_downloads.append({'type': file_type, 'meeting': title, 'url': url, 'error': str(e)})
 
         self.save_archive()
         self.save_failed_downloads()
@@ -551,7 +788,7 @@ def main() -> None:
     except KeyboardInterrupt:
         logger.info("Download interrupted by user")
     except Exception as e:
-        logger.error(f"Download failed: {e}")
+        logger.error("Download failed: %s", e)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,234 @@
+import csv
+import http.server
+import os
+import threading
+
+import pytest
+
+import fc_video_downloader as downloader
+
+DATA = bytes(range(256)) * 4096  # 1 MiB
+SHIPPED_CSV = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'fort_collins_all_meetings.csv')
+
+
+class _FileHandler(http.server.BaseHTTPRequestHandler):
+    """Serves ``server.body`` with Range/If-Range support; ``server.cut`` truncates the next reply."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append(dict(self.headers))
+        if self.path != '/file.mp4':
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        body, start = server.body, 0
+        rng = self.headers.get('Range')
+        if_range = self.headers.get('If-Range')
+        if rng and server.ranges and (if_range is None or if_range == server.etag):
+            start = int(rng.split('=')[1].split('-')[0])
+            if start >= len(body):
+                self.send_response(416)
+                self.send_header('Content-Range', f'bytes */{len(body)}')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes {start}-{len(body) - 1}/{len(body)}')
+        else:
+            self.send_response(200)
+        if server.etag:
+            self.send_header('ETag', server.etag)
+        self.send_header('Content-Length', str(len(body) - start))
+        self.end_headers()
+        if server.cut:
+            server.cut -= 1
+            self.wfile.write(body[start:start + len(body) // 3])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(body[start:])
+
+
+@pytest.fixture
+def server():
+    srv = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _FileHandler)
+    srv.daemon_threads = True
+    srv.body, srv.etag, srv.ranges, srv.cut, srv.requests = DATA, '"v1"', True, 0, []
+    thread = threading.Thread(target=srv.serve_forever, kwargs={'poll_interval': 0.01}, daemon=True)
+    thread.start()
+    srv.url = f'http://127.0.0.1:{srv.server_address[1]}/file.mp4'
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture
+def dl(tmp_path, monkeypatch):
+    monkeypatch.setattr(downloader.time, 'sleep', lambda seconds: None)
+    return downloader.EnhancedFortCollinsVideoDownloader(str(tmp_path / 'none.csv'), str(tmp_path / 'out'), 2)
+
+
+def _paths(dl):
+    target = dl.download_dir / 'videos' / 'file.mp4'
+    return target, target.with_name('file.mp4.part'), target.with_name('file.mp4.part.validator')
+
+
+def test_download_writes_file_and_leaves_no_part(server, dl):
+    target, part, validator = _paths(dl)
+    assert dl.download_file(server.url, target) == len(DATA)
+    assert target.read_bytes() == DATA
+    assert not part.exists() and not validator.exists()
+
+
+def test_cut_off_transfer_resumes_with_if_range(server, dl):
+    server.cut = 1
+    target, part, _ = _paths(dl)
+    assert dl.download_file(server.url, target) == len(DATA)
+    assert target.read_bytes() == DATA
+    assert not part.exists()
+    resume = server.requests[1]
+    assert resume['Range'].startswith('bytes=') and resume['Range'] != 'bytes=0-'
+    assert resume['If-Range'] == '"v1"'
+
+
+def test_part_from_earlier_run_is_resumed(server, dl):
+    target, part, validator = _paths(dl)
+    part.write_bytes(DATA[:1000])
+    validator.write_text('"v1"')
+    assert dl.download_file(server.url, target) == len(DATA)
+    assert target.read_bytes() == DATA
+    assert server.requests[0]['Range'] == 'bytes=1000-'
+
+
+def test_changed_file_is_fetched_whole_not_spliced(server, dl):
+    target, part, validator = _paths(dl)
+    part.write_bytes(b'x' * 1000)
+    validator.write_text('"v0"')
+    assert dl.download_file(server.url, target) == len(DATA)
+    assert target.read_bytes() == DATA
+
+
+def test_part_without_validator_starts_over(server, dl):
+    target, part, _ = _paths(dl)
+    part.write_bytes(b'x' * 1000)
+    assert dl.download_file(server.url, target) == len(DATA)
+    assert target.read_bytes() == DATA
+    assert 'Range' not in server.requests[0]
+
+
+def test_416_with_complete_part_renames_without_downloading(server, dl):
+    target, part, validator = _paths(dl)
+    part.write_bytes(DATA)
+    validator.write_text('"v1"')
+    assert dl.download_file(server.url, target) == len(DATA)
+    assert target.read_bytes() == DATA
+    assert len(server.requests) == 1
+    assert not part.exists() and not validator.exists()
+
+
+def test_416_with_oversized_part_restarts(server, dl):
+    target, part, validator = _paths(dl)
+    part.write_bytes(DATA + b'extra')
+    validator.write_text('"v1"')
+    assert dl.download_file(server.url, target) == len(DATA)
+    assert target.read_bytes() == DATA
+    assert 'Range' not in server.requests[1]
+
+
+def test_server_ignoring_range_sends_whole_file(server, dl):
+    server.ranges = False
+    server.cut = 1
+    target, _, _ = _paths(dl)
+    assert dl.download_file(server.url, target) == len(DATA)
+    assert target.read_bytes() == DATA
+
+
+def test_repeated_cut_offs_give_up_after_attempts(server, dl):
+    server.cut = 10
+    target, part, _ = _paths(dl)
+    assert dl.download_file(server.url, target, attempts=2) == 0
+    assert not target.exists()
+    assert len(server.requests) == 2
+    assert part.exists()  # Kept for the next run to resume
+
+
+def test_http_error_is_not_retried(server, dl):
+    target = dl.download_dir / 'videos' / 'missing.mp4'
+    assert dl.download_file(server.url.replace('file.mp4', 'missing.mp4'), target) == 0
+    assert len(server.requests) == 1
+    assert not target.exists()
+
+
+# --- Download planning ----------------------------------------------------------
+
+MEETING = {
+    'date': '08/28/2025',
+    'title': 'Urban Renewal Authority Board',
+    'meeting_type': 'Urban Renewal Authority Board Meeting',
+    'agenda_pdf': 'https://example.com/Documents/ViewAgenda?id=1',
+    'agenda_html': 'https://example.com/Documents/ViewAgenda?id=1&html=1',
+    'minutes_pdf': 'https://example.com/Documents/ViewMinutes?id=1',
+    'minutes_html': 'https://example.com/Documents/ViewMinutes?id=1&html=1',
+    'transcript_url': 'https://example.com/store-1/1-x/transcript.en.txt',
+    'audio_link': 'https://example.com/audio/1.mp3',
+    'mp4_download': 'https://example.com/store-1/1-x/vod.mp4',
+}
+
+
+def test_plan_gives_every_file_of_a_meeting_its_own_path(dl):
+    jobs = dl.plan_meeting_downloads(MEETING, True, True, True)
+    paths = [local_path for _, local_path, _ in jobs]
+    assert len(jobs) == 7
+    assert len(set(paths)) == len(paths)
+    names = {path.name for path in paths}
+    assert '08-28-2025_Urban_Renewal_Authority_Board_agenda.pdf' in names
+    assert '08-28-2025_Urban_Renewal_Authority_Board_minutes.pdf' in names
+
+
+def test_plan_skips_files_already_archived(dl):
+    target = dl.download_dir / 'documents' / 'old_name.pdf'
+    target.write_bytes(b'%PDF')
+    dl._on_disk.add(str(target))
+    dl.add_to_archive(MEETING['minutes_pdf'], MEETING['title'], MEETING['date'], 'document', target, 4)
+    urls = [url for url, _, _ in dl.plan_meeting_downloads(MEETING, False, False, True)]
+    assert MEETING['minutes_pdf'] not in urls
+    assert MEETING['agenda_pdf'] in urls
+
+
+def test_plan_for_shipped_csv_has_unique_paths(dl, monkeypatch):
+    monkeypatch.setattr(dl, '_resolve_cablecast_show_to_mp4', lambda url: '')
+    dl.csv_file = SHIPPED_CSV
+    seen = {}
+    for meeting in dl.load_csv_data().to_dict('records'):
+        if not isinstance(meeting['date'], str):
+            continue  # Undated rows cannot be named
+        for url, local_path, _ in dl.plan_meeting_downloads(meeting, True, True, True):
+            assert seen.setdefault(local_path, url) == url, local_path
+    assert seen
+
+
+def test_download_all_reports_a_path_collision_instead_of_dropping_it(dl, monkeypatch):
+    other_agenda = 'https://example.com/other.pdf'
+    rows = [dict(MEETING, minutes_pdf='', agenda_html='', minutes_html='', transcript_url='', audio_link=''),
+            dict(MEETING, agenda_pdf=other_agenda, minutes_pdf='', agenda_html='',
+                 minutes_html='', transcript_url='', audio_link='', mp4_download=MEETING['mp4_download'])]
+    with open(dl.csv_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=list(MEETING))
+        writer.writeheader()
+        writer.writerows(rows)
+    downloaded = []
+    monkeypatch.setattr(dl, 'download_file', lambda url, local_path: downloaded.append(url) or 1)
+    dl.download_all()
+    # The shared video is fetched once. Whichever agenda is planned second would
+    # overwrite the first, so it is reported as failed instead
+    assert downloaded.count(MEETING['mp4_download']) == 1
+    agendas = {MEETING['agenda_pdf'], other_agenda}
+    queued = agendas.intersection(downloaded)
+    assert len(queued) == 1 and len(downloaded) == 2
+    assert [failed['url'] for failed in dl.failed_downloads] == list(agendas - queued)
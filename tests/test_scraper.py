@@ -0,0 +1,205 @@
+import csv
+import os
+
+import pytest
+from bs4 import BeautifulSoup
+
+import fc_meeting_scraper as scraper
+
+SHIPPED_CSV = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'fort_collins_all_meetings.csv')
+
+LISTING = ('<html><head>{meta}<title>Search</title></head><body><ul>'
+           '<li><a href="/CablecastPublicSite/show/101?site=1">City Council Regular Meeting 9/2/25</a></li>'
+           '<li><span>Planning &amp; Zoning</span> <a href="/CablecastPublicSite/show/102">Comisión 8/1/25</a>'
+           '<!-- note --><script>var x = 1;</script> · señal</li>'
+           '<li><a href="/about">Café — about</a></li>'
+           '<li><a name="anchor">no href</a></li>'
+           '</ul></body></html>')
+
+
+def _soup_links(content):
+    """The BeautifulSoup version _listing_links replaced."""
+    soup = BeautifulSoup(content, 'lxml')
+    return [(a.get('href'), a.parent.get_text(strip=True)) for a in soup.find_all('a', href=True)]
+
+
+@pytest.mark.parametrize('encoding, meta', [
+    ('utf-8', ''),
+    ('utf-8', '<meta charset="utf-8">'),
+    ('windows-1252', '<meta http-equiv="Content-Type" content="text/html; charset=windows-1252">'),
+    ('utf-16', ''),
+])
+def test_listing_links_matches_beautifulsoup(encoding, meta):
+    content = LISTING.format(meta=meta).encode(encoding)
+    assert scraper._listing_links(content) == _soup_links(content)
+
+
+def test_listing_links_decodes_utf8_without_meta_charset():
+    content = LISTING.format(meta='').encode('utf-8')
+    texts = [text for _, text in scraper._listing_links(content)]
+    assert 'Planning & ZoningComisión 8/1/25· señal' in texts
+    assert 'Café — about' in texts
+
+
+def test_listing_links_skips_anchors_without_href():
+    hrefs = [href for href, _ in scraper._listing_links(LISTING.format(meta='').encode())]
+    assert hrefs == ['/CablecastPublicSite/show/101?site=1', '/CablecastPublicSite/show/102', '/about']
+
+
+def test_listing_links_tolerates_empty_page():
+    assert scraper._listing_links(b'') == []
+
+
+def test_fast_page_title_decodes_utf8_without_meta_charset():
+    content = '<html><body><h1>Conseil — Fort Collins ñ</h1></body></html>'.encode('utf-8')
+    assert scraper._fast_page_title(content) == 'Conseil — Fort Collins ñ'
+
+
+# --- Title classification -------------------------------------------------
+
+def _baseline_is_fort_collins(title):
+    """is_fort_collins_meeting as the original scraper wrote it."""
+    title_lower = title.lower()
+    exclude_terms = [
+        'larimer county', 'larimer co', 'bocc', 'board of county commissioners',
+        'county administrative', 'county planning', 'county land use',
+        'board of social services', 'environmental stewardship'
+    ]
+    if any(term in title_lower for term in exclude_terms):
+        return False
+    include_terms = [
+        'fort collins city council', 'city council', 'fc city council',
+        'fort collins council',
+        'urban renewal authority', 'urban renewal', 'fort collins urban renewal',
+        'historic preservation commission',
+        'historic preservation',
+        'planning & zoning commission',
+        'planning and zoning commission'
+    ]
+    return any(term in title_lower for term in include_terms)
+
+
+def _baseline_meeting_type(title):
+    """categorize_meeting_type as the original scraper wrote it."""
+    title_lower = title.lower()
+    if 'historic preservation' in title_lower:
+        if 'regular' in title_lower:
+            return 'Historic Preservation Commission Regular Meeting'
+        return 'Historic Preservation Commission Meeting'
+    if 'planning & zoning' in title_lower or 'planning and zoning' in title_lower:
+        if 'regular' in title_lower:
+            return 'Planning & Zoning Commission Regular Meeting'
+        return 'Planning & Zoning Commission Meeting'
+    if 'urban renewal' in title_lower:
+        if 'workshop' in title_lower:
+            return 'Urban Renewal Authority Workshop'
+        return 'Urban Renewal Authority Board Meeting'
+    if 'regular meeting' in title_lower or 'regular' in title_lower:
+        return 'City Council Regular Meeting'
+    if 'work session' in title_lower:
+        return 'City Council Work Session'
+    if 'special meeting' in title_lower or 'special' in title_lower:
+        return 'City Council Special Meeting'
+    if 'adjourned' in title_lower:
+        return 'City Council Adjourned Meeting'
+    return 'City Council Meeting'
+
+
+_KEYWORDS = ['City Council', 'Fort Collins Council', 'FC City Council', 'Urban Renewal', 'Workshop',
+             'Historic Preservation', 'Planning & Zoning Commission', 'Planning and Zoning Commission',
+             'Planning & Zoning', 'Regular', 'Work Session', 'Special', 'Adjourned', 'Larimer County',
+             'BOCC', 'County Planning', 'Board of Social Services', 'Environmental Stewardship',
+             'Library Board', 'Meeting 9/2/25', '']
+
+
+def _titles():
+    titles = ['', 'City Council Regular Meeting', 'LARIMER CO Fair Board', 'Larimer Colorado city council',
+              'Urban Renewal Authority Board Workshop 5/22/25', 'Historic Preservation Commission Regular Meeting',
+              'Planning and zoning commission special', 'Fort Collins City Council Regular Meeting & Work Session 6/3/25',
+              'Citizen Review Board', 'Water Board Regular Meeting', 'Adjourned', 'CITY COUNCIL WORK SESSION']
+    # Every ordered pair of keywords, so include/exclude and category precedence are all exercised
+    titles += [f'{a} {b}'.strip() for a in _KEYWORDS for b in _KEYWORDS]
+    return titles
+
+
+def test_classify_title_matches_baseline():
+    for title in _titles():
+        assert scraper._classify_title(title) == (_baseline_is_fort_collins(title), _baseline_meeting_type(title)), title
+
+
+def test_classify_title_matches_baseline_for_shipped_csv():
+    with open(SHIPPED_CSV, newline='', encoding='utf-8') as f:
+        titles = {row['title'] for row in csv.DictReader(f)}
+    for title in titles:
+        assert scraper._classify_title(title) == (_baseline_is_fort_collins(title), _baseline_meeting_type(title)), title
+
+
+# --- save_to_csv ------------------------------------------------------------
+
+def _meeting(date, title, **extra):
+    return dict({'date': date, 'title': title, 'meeting_type': 'City Council Meeting', 'source': 'test'}, **extra)
+
+
+@pytest.fixture
+def scraper_in_tmp(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return scraper.FortCollinsVideoScraper(use_cache=False)
+
+
+def _saved(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def test_save_to_csv_sorts_newest_first_across_date_formats(scraper_in_tmp, tmp_path):
+    scraper_in_tmp.meetings_data = [
+        _meeting('01/07/2025', 'A'),
+        _meeting('8/26/25', 'B'),    # Cablecast titles use two-digit years
+        _meeting('12/17/2024', 'C'),
+        _meeting('09/02/2025', 'D'),
+    ]
+    out = tmp_path / 'out.csv'
+    scraper_in_tmp.save_to_csv(str(out))
+    assert [row['title'] for row in _saved(out)] == ['D', 'B', 'A', 'C']
+
+
+def test_save_to_csv_puts_undated_rows_last_in_discovery_order(scraper_in_tmp, tmp_path):
+    scraper_in_tmp.meetings_data = [
+        _meeting('', 'no date 1'),
+        _meeting('01/07/2025', 'A'),
+        _meeting('not a date', 'no date 2'),
+        _meeting('01/07/2025', 'A2'),
+        _meeting('', 'no date 3'),
+    ]
+    out = tmp_path / 'out.csv'
+    scraper_in_tmp.save_to_csv(str(out))
+    assert [row['title'] for row in _saved(out)] == ['A', 'A2', 'no date 1', 'no date 2', 'no date 3']
+
+
+def test_save_to_csv_keeps_first_of_duplicate_title_and_date(scraper_in_tmp, tmp_path):
+    scraper_in_tmp.meetings_data = [
+        _meeting('01/07/2025', 'A', source='municode'),
+        _meeting('01/07/2025', 'A', source='cablecast'),
+        _meeting('01/21/2025', 'A', source='cablecast'),
+    ]
+    out = tmp_path / 'out.csv'
+    scraper_in_tmp.save_to_csv(str(out))
+    assert [(row['date'], row['source']) for row in _saved(out)] == [('01/21/2025', 'cablecast'),
+                                                                    ('01/07/2025', 'municode')]
+
+
+def test_save_to_csv_writes_every_column_and_removes_checkpoint(scraper_in_tmp, tmp_path):
+    scraper_in_tmp._open_checkpoint(str(tmp_path / 'partial.csv'))
+    scraper_in_tmp._add_meeting(_meeting('01/07/2025', 'A', video_id=7, unknown='dropped'))
+    assert (tmp_path / 'partial.csv').exists()
+    out = tmp_path / 'out.csv'
+    scraper_in_tmp.save_to_csv(str(out))
+    with open(out, newline='', encoding='utf-8') as f:
+        assert next(csv.reader(f)) == scraper._CSV_FIELDS
+    assert _saved(out)[0]['video_id'] == '7'
+    assert not (tmp_path / 'partial.csv').exists()
+
+
+def test_save_to_csv_without_meetings_writes_nothing(scraper_in_tmp, tmp_path):
+    scraper_in_tmp.save_to_csv(str(tmp_path / 'out.csv'))
+    assert not (tmp_path / 'out.csv').exists()